@@ -1,14 +1,26 @@
 import asyncio
-import threading
+import os
+import stat
+import time
+from collections.abc import Iterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID
 
+import orjson
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from iso639 import Language as Iso639Language
+from pymediainfo import MediaInfo
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
 
 from backend.schemas import (
     AddJobRequest,
@@ -29,7 +41,44 @@ from core.payloads.mux_job import MuxJob
 from core.queue_manager import QueueCallback, QueueManager
 from core.utils.autoqpf import auto_gen_chapters
 from core.utils.file_utils import browse_directory
-from core.utils.mediainfo import get_media_info, get_media_info_web
+from core.utils.language import get_language_obj
+from core.utils.mediainfo import get_media_info
+
+# max rate (seconds between flushes) for coalesced job progress broadcasts
+PROGRESS_FLUSH_INTERVAL = 0.05
+
+# mux jobs processed in parallel (remuxing is mostly I/O bound)
+MAX_CONCURRENT_JOBS = min(os.cpu_count() or 2, 4)
+
+# seconds a directory listing may be reused by /api/browse
+BROWSE_CACHE_TTL = 2
+
+# number of jobs per WebSocket message when sending the initial job list
+INIT_CHUNK_SIZE = 50
+
+# text files larger than this are streamed by /api/read-file instead of loaded
+READ_FILE_STREAM_THRESHOLD = 1024 * 1024
+
+# chunk size for streamed /api/read-file responses
+READ_FILE_CHUNK_SIZE = 64 * 1024
+
+# map backend status to frontend status names
+_FRONTEND_STATUS = {
+    JobStatus.QUEUED: "pending",
+    JobStatus.PROCESSING: "processing",
+    JobStatus.COMPLETED: "completed",
+    JobStatus.FAILED: "failed",
+    JobStatus.CANCELLED: "failed",  # treat cancelled as failed for frontend
+}
+
+# frontend log level -> logger method
+_LEVEL_DISPATCH = {
+    LogLevel.DEBUG: LOG.debug,
+    LogLevel.INFO: LOG.info,
+    LogLevel.WARNING: LOG.warning,
+    LogLevel.ERROR: LOG.error,
+    LogLevel.CRITICAL: LOG.critical,
+}
 
 
 @dataclass(slots=True)
@@ -37,10 +86,15 @@ class AppState:
     """Application state container."""
 
     queue_manager: QueueManager
-    active_connections: list[WebSocket] = field(default_factory=list)
-    processor_thread: threading.Thread | None = None
+    active_connections: set[WebSocket] = field(default_factory=set)
+    job_queue: asyncio.Queue[UUID] = field(default_factory=asyncio.Queue)
+    worker_tasks: list[asyncio.Task] = field(default_factory=list)
+    active_jobs: int = 0
     processor_running: bool = False
-    processor_lock: threading.Lock = field(default_factory=threading.Lock)
+    processor_resume: asyncio.Event = field(default_factory=asyncio.Event)
+    pending_progress: dict[UUID, MuxJob] = field(default_factory=dict)
+    progress_event: asyncio.Event = field(default_factory=asyncio.Event)
+    flusher_task: asyncio.Task | None = None
 
 
 @asynccontextmanager
@@ -50,67 +104,129 @@ async def lifespan(app: FastAPI):
     queue_manager = QueueManager()
     queue_manager.enable_persistence()
 
-    app.state.app_state = AppState(queue_manager=queue_manager)
+    state = AppState(queue_manager=queue_manager)
+    app.state.app_state = state
 
     # register WebSocket callback
-    web_callback = WebQueueCallback(app)
+    web_callback = WebQueueCallback(state, asyncio.get_running_loop())
     queue_manager.register_callback(web_callback)
 
+    # feed persisted queued jobs to the worker, it stays idle until started
+    for job in queue_manager.get_queued_jobs():
+        state.job_queue.put_nowait(job.job_id)
+    state.worker_tasks = [
+        asyncio.create_task(queue_worker(state)) for _ in range(MAX_CONCURRENT_JOBS)
+    ]
+    state.flusher_task = asyncio.create_task(progress_flusher(state))
+
     yield
 
     # cleanup: stop processor if running
-    state = app.state.app_state
-    with state.processor_lock:
-        state.processor_running = False
-    if state.processor_thread and state.processor_thread.is_alive():
-        state.processor_thread.join(timeout=5.0)
-
-
-app = FastAPI(lifespan=lifespan)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    state.processor_running = False
+    queue_manager.unregister_callback(web_callback)
+    tasks = (*state.worker_tasks, state.flusher_task)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    Conf.flush()
 
 
-class WebSocketCallback(ProgressCallback):
-    """Send progress via WebSocket."""
+# built web frontend (present in the production Docker image)
+frontend_build_path = Path(__file__).parent.parent / "frontend_web" / "build"
+frontend_build_exists = frontend_build_path.exists()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# the built SPA is served from the same origin (and the Vite dev server proxies
+# /api and /ws), so CORS is only needed for cross-origin clients during dev
+if not frontend_build_exists:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "DELETE"],
+        allow_headers=["*"],
+    )
 
-    def __init__(self, websocket: WebSocket):
-        self.websocket = websocket
 
-    async def on_progress(self, percent: float, message: str):
-        await self.websocket.send_json(
-            {"type": "progress", "percent": percent, "message": message}
-        )
+def _require_file(file_path: Path) -> os.stat_result:
+    """Stat the path, raising an HTTPException if missing or not a file (blocking)."""
+    try:
+        file_stat = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
+
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise HTTPException(status_code=400, detail=f"Path is not a file: {file_path}")
+
+    return file_stat
+
+
+def _iter_file_chunks(file_path: Path) -> Iterator[bytes]:
+    """Yield a file in READ_FILE_CHUNK_SIZE blocks (blocking, run in the threadpool)."""
+    with open(file_path, "rb") as f:
+        while chunk := f.read(READ_FILE_CHUNK_SIZE):
+            yield chunk
+
+
+@lru_cache(maxsize=256)
+def _media_info_cached(path_str: str, mtime_ns: int, size: int) -> MediaInfo:
+    """Parse MediaInfo once per file version (mtime/size invalidate the entry)."""
+    media_info, _ = get_media_info(Path(path_str))
+    return media_info
+
 
-    async def on_complete(self, output_file: str):
-        await self.websocket.send_json({"type": "complete", "output": output_file})
+@lru_cache(maxsize=256)
+def _media_info_json_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """MediaInfo JSON for the web, sharing the parse cache (blocking)."""
+    return _media_info_cached(path_str, mtime_ns, size).to_json()
 
-    async def on_error(self, error: str):
-        await self.websocket.send_json({"type": "error", "error": error})
+
+def _extract_chapters(path_str: str, mtime_ns: int, size: int) -> str | None:
+    """Generate chapters from cached MediaInfo (blocking)."""
+    return auto_gen_chapters(_media_info_cached(path_str, mtime_ns, size))
+
+
+@lru_cache(maxsize=64)
+def _browse_directory_cached(path_str: str, mtime_ns: int, time_bucket: int) -> dict:
+    """Directory listing memoized per directory mtime and short time window."""
+    return browse_directory(Path(path_str))
+
+
+def _browse_directory(target_path: Path) -> dict:
+    """Browse a directory, reusing recent listings for rapid refreshes (blocking).
+
+    Adding/removing entries bumps the directory mtime, so those show up at once;
+    only file sizes can be up to BROWSE_CACHE_TTL seconds stale.
+    """
+    resolved = target_path.resolve()
+    return _browse_directory_cached(
+        str(resolved),
+        resolved.stat().st_mtime_ns,
+        int(time.monotonic() // BROWSE_CACHE_TTL),
+    )
+
+
+def _default_browse_path() -> Path:
+    """Resolve the default browse root (blocking)."""
+    # check if we're in Docker (/data exists)
+    data_dir = Path("/data")
+    return data_dir if data_dir.exists() else Path.home()
 
 
 @app.post("/api/mediainfo")
 async def get_mediainfo(request: MediaInfoRequest):
     """Get MediaInfo for a file path."""
-    file_path = Path(request.file_path)
-
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=404, detail=f"File not found: {request.file_path}"
-        )
-
-    if not file_path.is_file():
-        raise HTTPException(
-            status_code=400, detail=f"Path is not a file: {request.file_path}"
-        )
+    file_path = request.file_path
+    file_stat = await run_in_threadpool(_require_file, file_path)
 
     try:
-        mediainfo_json = get_media_info_web(file_path)
+        mediainfo_json = await run_in_threadpool(
+            _media_info_json_cached,
+            str(file_path),
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+        )
         return {"mediainfo": mediainfo_json}
     except Exception as e:
         raise HTTPException(
@@ -126,14 +242,9 @@ async def browse_dir(request: BrowseRequest):
         if request.path:
             target_path = Path(request.path)
         else:
-            # check if we're in Docker (/data exists)
-            data_dir = Path("/data")
-            if data_dir.exists():
-                target_path = data_dir
-            else:
-                target_path = Path.home()
-
-        result = browse_directory(target_path)
+            target_path = await run_in_threadpool(_default_browse_path)
+
+        result = await run_in_threadpool(_browse_directory, target_path)
         LOG.debug(f"Browse result: {result['current_path']}")
         return result
     except PermissionError as e:
@@ -169,36 +280,22 @@ async def create_folder(request: BrowseRequest):
 @app.post("/api/log")
 async def log_from_frontend(request: LogRequest) -> None:
     """Log message from frontend with specified log level."""
-    if request.level is LogLevel.DEBUG:
-        LOG.debug(request.message, LOG.SRC.FE)
-    elif request.level is LogLevel.INFO:
-        LOG.info(request.message, LOG.SRC.FE)
-    elif request.level is LogLevel.WARNING:
-        LOG.warning(request.message, LOG.SRC.FE)
-    elif request.level is LogLevel.ERROR:
-        LOG.error(request.message, LOG.SRC.FE)
-    elif request.level is LogLevel.CRITICAL:
-        LOG.critical(request.message, LOG.SRC.FE)
+    _LEVEL_DISPATCH.get(request.level, LOG.info)(request.message, LOG.SRC.FE)
 
 
 @app.post("/api/extract-chapters")
 async def extract_chapters(request: ExtractChaptersRequest):
     """Extract chapters from a video file."""
-    file_path = Path(request.file_path)
-
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=404, detail=f"File not found: {request.file_path}"
-        )
-
-    if not file_path.is_file():
-        raise HTTPException(
-            status_code=400, detail=f"Path is not a file: {request.file_path}"
-        )
+    file_path = request.file_path
+    file_stat = await run_in_threadpool(_require_file, file_path)
 
     try:
-        media_info, _ = get_media_info(file_path)
-        chapters = auto_gen_chapters(media_info)
+        chapters = await run_in_threadpool(
+            _extract_chapters,
+            str(file_path),
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+        )
         return {"chapters": chapters if chapters else ""}
     except Exception as e:
         raise HTTPException(
@@ -208,22 +305,21 @@ async def extract_chapters(request: ExtractChaptersRequest):
 
 @app.post("/api/read-file")
 async def read_file(request: ReadFileRequest):
-    """Read a text file and return its contents."""
-    file_path = Path(request.file_path)
+    """Read a text file and return its contents.
 
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=404, detail=f"File not found: {request.file_path}"
-        )
+    Large files are streamed as text/plain instead of a {"content": ...} body.
+    """
+    file_path = request.file_path
+    file_stat = await run_in_threadpool(_require_file, file_path)
 
-    if not file_path.is_file():
-        raise HTTPException(
-            status_code=400, detail=f"Path is not a file: {request.file_path}"
+    if file_stat.st_size > READ_FILE_STREAM_THRESHOLD:
+        # starlette iterates sync generators in its threadpool
+        return StreamingResponse(
+            _iter_file_chunks(file_path), media_type="text/plain; charset=utf-8"
         )
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+        content = await run_in_threadpool(file_path.read_text, encoding="utf-8")
         return {"content": content}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading file: {str(e)}")
@@ -234,14 +330,22 @@ async def job_websocket(websocket: WebSocket):
     """WebSocket endpoint for real-time job updates."""
     state = app.state.app_state
     await websocket.accept()
-    state.active_connections.append(websocket)
+    state.active_connections.add(websocket)
 
     try:
-        # send initial job list
+        # send initial job list in chunks so the UI can render the first page
+        # right away; "init" resets the client list, "init_chunk" appends to it
         jobs = state.queue_manager.get_all_jobs()
-        await websocket.send_json(
-            {"type": "init", "jobs": [serialize_job(job) for job in jobs]}
-        )
+        for start in range(0, max(len(jobs), 1), INIT_CHUNK_SIZE):
+            end = start + INIT_CHUNK_SIZE
+            message = {
+                "type": "init" if start == 0 else "init_chunk",
+                "jobs": [serialize_job(job) for job in jobs[start:end]],
+                "done": end >= len(jobs),
+            }
+            await websocket.send_text(dumps_message(message))
+            # let other clients/tasks run between chunks
+            await asyncio.sleep(0)
 
         # keep connection alive and listen for commands
         while True:
@@ -249,37 +353,57 @@ async def job_websocket(websocket: WebSocket):
             # handle client commands if needed
 
     except WebSocketDisconnect:
-        state.active_connections.remove(websocket)
+        state.active_connections.discard(websocket)
     except Exception as e:
         LOG.error(f"WebSocket error: {e}")
-        if websocket in state.active_connections:
-            state.active_connections.remove(websocket)
+        state.active_connections.discard(websocket)
 
 
 async def broadcast_job_update(state: AppState, job: MuxJob, event_type: str):
     """Broadcast job update to all connected clients."""
-    message = {"type": event_type, "job": serialize_job(job)}
-    for connection in state.active_connections:
-        try:
-            await connection.send_json(message)
-        except Exception as e:
-            LOG.error(f"Failed to send update to client: {e}")
+    # encode once, then send the same text frame to every client
+    message = dumps_message({"type": event_type, "job": serialize_job(job)})
+    # snapshot so connects/disconnects during the sends don't affect this broadcast
+    connections = tuple(state.active_connections)
+    results = await asyncio.gather(
+        *(connection.send_text(message) for connection in connections),
+        return_exceptions=True,
+    )
+
+    # prune clients whose send failed
+    for connection, result in zip(connections, results):
+        if isinstance(result, Exception):
+            LOG.error(f"Failed to send update to client: {result}")
+            state.active_connections.discard(connection)
+
+
+def queue_progress_update(state: AppState, job: MuxJob) -> None:
+    """Record the latest progress for a job, to be sent by the flusher."""
+    state.pending_progress[job.job_id] = job
+    state.progress_event.set()
+
+
+async def progress_flusher(state: AppState) -> None:
+    """Broadcast coalesced job progress at most once per flush interval."""
+    while True:
+        await state.progress_event.wait()
+        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+        state.progress_event.clear()
+        pending, state.pending_progress = state.pending_progress, {}
+        for job in pending.values():
+            await broadcast_job_update(state, job, "job_progress")
+
+
+def dumps_message(message: dict) -> str:
+    """Encode a WebSocket message with orjson (text frame for the web client)."""
+    return orjson.dumps(message, default=str).decode()
 
 
 def serialize_job(job: MuxJob) -> dict:
     """Serialize MuxJob to JSON-compatible dict."""
-    # map backend status to frontend status names
-    status_map = {
-        "QUEUED": "pending",
-        "PROCESSING": "processing",
-        "COMPLETED": "completed",
-        "FAILED": "failed",
-        "CANCELLED": "failed",  # treat cancelled as failed for frontend
-    }
-
     return {
         "id": str(job.job_id),
-        "status": status_map.get(job.status.name, job.status.name.lower()),
+        "status": _FRONTEND_STATUS[job.status],
         "progress": job.progress,
         "videoFile": str(job.video.input_file) if job.video else None,
         "audioTracks": [str(track.input_file) for track in job.audio_tracks],
@@ -296,33 +420,28 @@ def serialize_job(job: MuxJob) -> dict:
 class WebQueueCallback(QueueCallback):
     """Callback to broadcast queue changes via WebSocket."""
 
-    def __init__(self, app: FastAPI) -> None:
+    def __init__(self, state: AppState, loop: asyncio.AbstractEventLoop) -> None:
         super().__init__()
-        self.app = app
-        self.main_event_loop = asyncio.get_event_loop()
+        self.state = state
+        self.loop = loop
+        # strong refs so in-flight broadcast tasks aren't garbage collected
+        self._tasks: set[asyncio.Task] = set()
+
+    def _broadcast(self, job: MuxJob, event_type: str) -> None:
+        """Schedule a broadcast task (runs on the event loop)."""
+        task = asyncio.create_task(broadcast_job_update(self.state, job, event_type))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     def on_job_added(self, job: MuxJob):
-        if self.main_event_loop and not self.main_event_loop.is_closed():
-            asyncio.run_coroutine_threadsafe(
-                broadcast_job_update(self.app.state.app_state, job, "job_added"),
-                self.main_event_loop,
-            )
+        self.loop.call_soon_threadsafe(self._broadcast, job, "job_added")
 
     def on_job_status_changed(self, job: MuxJob):
-        if self.main_event_loop and not self.main_event_loop.is_closed():
-            asyncio.run_coroutine_threadsafe(
-                broadcast_job_update(
-                    self.app.state.app_state, job, "job_status_changed"
-                ),
-                self.main_event_loop,
-            )
+        self.loop.call_soon_threadsafe(self._broadcast, job, "job_status_changed")
 
     def on_job_progress(self, job: MuxJob, progress: float, message: str):
-        if self.main_event_loop and not self.main_event_loop.is_closed():
-            asyncio.run_coroutine_threadsafe(
-                broadcast_job_update(self.app.state.app_state, job, "job_progress"),
-                self.main_event_loop,
-            )
+        # only the latest tick per job is kept and flushed on the loop
+        self.loop.call_soon_threadsafe(queue_progress_update, self.state, job)
 
 
 class BackendProgressCallback(ProgressCallback):
@@ -342,52 +461,83 @@ class BackendProgressCallback(ProgressCallback):
         self.queue_manager.update_job_status(self.job_id, JobStatus.FAILED, error)
 
 
-def process_queue(state: AppState):
-    """Background thread to process queued jobs."""
-    LOG.info("Queue processor started")
-
-    while state.processor_running:
-        with state.processor_lock:
-            if not state.processor_running:
-                break
+async def run_job(state: AppState, job: MuxJob) -> None:
+    """Mux a single job (MP4Box runs on the event loop, status writes in the threadpool)."""
+    try:
+        LOG.info(f"Processing job {job.job_id}: {job.output_file}")
+
+        # create muxer with progress callback
+        callback = BackendProgressCallback(job.job_id, state.queue_manager)
+        muxer = VideoMuxer(progress_callback=callback)
+
+        # process the job
+        await muxer.mux_from_job_async(job)
+
+        # check if job was cancelled during processing
+        current_job = state.queue_manager.get_job(job.job_id)
+        if current_job and current_job.status == JobStatus.CANCELLED:
+            LOG.info(f"Job {job.job_id} was cancelled")
+        elif current_job and current_job.status != JobStatus.COMPLETED:
+            # If not already marked completed or cancelled, mark it
+            await run_in_threadpool(
+                state.queue_manager.update_job_status, job.job_id, JobStatus.COMPLETED
+            )
+            LOG.info(f"Job {job.job_id} completed successfully")
 
-            queued_jobs = state.queue_manager.get_queued_jobs()
+    except Exception as e:
+        error_msg = f"Job failed: {str(e)}"
+        LOG.error(f"Job {job.job_id} failed: {e}")
+        await run_in_threadpool(
+            state.queue_manager.update_job_status,
+            job.job_id,
+            JobStatus.FAILED,
+            error_msg,
+        )
 
-            if not queued_jobs:
-                # no more jobs to process, stop processor
-                LOG.info("No more jobs in queue, stopping processor")
-                state.processor_running = False
-                break
 
-            job = queued_jobs[0]
+async def queue_worker(state: AppState) -> None:
+    """Long-lived task that pulls job IDs off the queue while processing is on.
 
+    Several of these run concurrently, one per mux slot.
+    """
+    while True:
+        await state.processor_resume.wait()
+        job_id = await state.job_queue.get()
         try:
-            LOG.info(f"Processing job {job.job_id}: {job.output_file}")
-
-            # create muxer with progress callback
-            callback = BackendProgressCallback(job.job_id, state.queue_manager)
-            muxer = VideoMuxer(progress_callback=callback)
-
-            # process the job
-            muxer.mux_from_job(job)
-
-            # check if job was cancelled during processing
-            current_job = state.queue_manager.get_job(job.job_id)
-            if current_job and current_job.status == JobStatus.CANCELLED:
-                LOG.info(f"Job {job.job_id} was cancelled")
-            elif current_job and current_job.status != JobStatus.COMPLETED:
-                # If not already marked completed or cancelled, mark it
-                state.queue_manager.update_job_status(job.job_id, JobStatus.COMPLETED)
-                LOG.info(f"Job {job.job_id} completed successfully")
-
-        except Exception as e:
-            error_msg = f"Job failed: {str(e)}"
-            LOG.error(f"Job {job.job_id} failed: {e}")
-            state.queue_manager.update_job_status(
-                job.job_id, JobStatus.FAILED, error_msg
-            )
-
-    LOG.info("Queue processor stopped")
+            # processing may have been stopped while we waited for a job, hold
+            # on to it until the queue is started again
+            await state.processor_resume.wait()
+
+            # skip jobs that were removed or cancelled while waiting
+            job = state.queue_manager.get_job(job_id)
+            if job and job.status == JobStatus.QUEUED:
+                state.active_jobs += 1
+                try:
+                    await run_job(state, job)
+                finally:
+                    state.active_jobs -= 1
+        finally:
+            state.job_queue.task_done()
+
+        if (
+            state.processor_running
+            and state.job_queue.empty()
+            and not state.active_jobs
+        ):
+            # no more jobs to process, stop processor
+            LOG.info("No more jobs in queue, stopping processor")
+            _set_processor_running(state, False)
+
+
+def _set_processor_running(state: AppState, running: bool) -> None:
+    """Toggle whether the queue worker pulls new jobs."""
+    state.processor_running = running
+    if running:
+        state.processor_resume.set()
+        LOG.info("Queue processor started")
+    else:
+        state.processor_resume.clear()
+        LOG.info("Queue processor stopped")
 
 
 @app.post("/api/queue/start")
@@ -395,39 +545,29 @@ async def start_queue_processing():
     """Start processing the queue."""
     state = app.state.app_state
 
-    with state.processor_lock:
-        if state.processor_running:
-            return {"success": True, "message": "Queue processor already running"}
+    if state.processor_running:
+        return {"success": True, "message": "Queue processor already running"}
 
-        # Check if there are any queued jobs
-        queued_jobs = state.queue_manager.get_queued_jobs()
-        if not queued_jobs:
-            raise HTTPException(status_code=400, detail="No jobs in queue to process")
+    # Check if there are any queued jobs
+    queued_jobs = state.queue_manager.get_queued_jobs()
+    if not queued_jobs:
+        raise HTTPException(status_code=400, detail="No jobs in queue to process")
 
-        state.processor_running = True
-        state.processor_thread = threading.Thread(
-            target=process_queue, args=(state,), daemon=True
-        )
-        state.processor_thread.start()
+    _set_processor_running(state, True)
 
-        LOG.info("Queue processing started")
-        return {"success": True, "message": "Queue processor started"}
+    LOG.info("Queue processing started")
+    return {"success": True, "message": "Queue processor started"}
 
 
 @app.post("/api/queue/stop")
 async def stop_queue_processing():
-    """Stop processing the queue."""
+    """Stop processing the queue (the current job is allowed to finish)."""
     state = app.state.app_state
 
-    with state.processor_lock:
-        if not state.processor_running:
-            return {"success": True, "message": "Queue processor not running"}
-
-        state.processor_running = False
+    if not state.processor_running:
+        return {"success": True, "message": "Queue processor not running"}
 
-    # Wait for thread to finish (with timeout)
-    if state.processor_thread and state.processor_thread.is_alive():
-        state.processor_thread.join(timeout=5.0)
+    _set_processor_running(state, False)
 
     LOG.info("Queue processing stopped")
     return {"success": True, "message": "Queue processor stopped"}
@@ -461,61 +601,38 @@ async def add_job_to_queue(request: AddJobRequest):
         )
 
         # build VideoState
-        video_lang = None
-        if request.video_language:
-            try:
-                video_lang = Iso639Language.match(request.video_language)
-            except:
-                pass
-
         video_state = VideoState(
             input_file=Path(request.video_file),
-            language=video_lang,
+            language=get_language_obj(request.video_language),
             title=request.video_title or "",
             delay_ms=request.video_delay,
         )
 
         # build AudioStates
-        audio_states = []
-        for audio in request.audio_tracks:
-            audio_lang = None
-            if audio.get("language"):
-                try:
-                    audio_lang = Iso639Language.match(audio["language"])
-                except:
-                    pass
-
-            audio_states.append(
-                AudioState(
-                    input_file=Path(audio["filePath"]),
-                    language=audio_lang,
-                    title=audio.get("title", ""),
-                    delay_ms=audio.get("delay", 0),
-                    default=audio.get("isDefault", False),
-                    track_id=audio.get("trackId"),
-                )
+        audio_states = [
+            AudioState(
+                input_file=Path(audio.file_path),
+                language=get_language_obj(audio.language),
+                title=audio.title or "",
+                delay_ms=audio.delay or 0,
+                default=audio.is_default,
+                track_id=audio.track_id,
             )
+            for audio in request.audio_tracks
+        ]
 
         # build SubtitleStates
-        subtitle_states = []
-        for subtitle in request.subtitle_tracks:
-            sub_lang = None
-            if subtitle.get("language"):
-                try:
-                    sub_lang = Iso639Language.match(subtitle["language"])
-                except:
-                    pass
-
-            subtitle_states.append(
-                SubtitleState(
-                    input_file=Path(subtitle["filePath"]),
-                    language=sub_lang,
-                    title=subtitle.get("title", ""),
-                    default=subtitle.get("isDefault", False),
-                    forced=subtitle.get("isForced", False),
-                    track_id=subtitle.get("trackId"),
-                )
+        subtitle_states = [
+            SubtitleState(
+                input_file=Path(subtitle.file_path),
+                language=get_language_obj(subtitle.language),
+                title=subtitle.title or "",
+                default=subtitle.is_default,
+                forced=subtitle.is_forced,
+                track_id=subtitle.track_id,
             )
+            for subtitle in request.subtitle_tracks
+        ]
 
         # build ChapterState if chapters provided
         chapter_state = None
@@ -537,7 +654,8 @@ async def add_job_to_queue(request: AddJobRequest):
 
         # add to queue
         state = app.state.app_state
-        job_id = state.queue_manager.add_job(job)
+        job_id = await run_in_threadpool(state.queue_manager.add_job, job)
+        await state.job_queue.put(job_id)
 
         return {"success": True, "job_id": str(job_id), "job": serialize_job(job)}
     except Exception as e:
@@ -549,7 +667,7 @@ async def add_job_to_queue(request: AddJobRequest):
 async def clear_completed_jobs():
     """Remove all completed/failed/cancelled jobs."""
     state = app.state.app_state
-    state.queue_manager.clear_completed()
+    await run_in_threadpool(state.queue_manager.clear_completed)
     return {"success": True}
 
 
@@ -559,7 +677,7 @@ async def cancel_job(job_id: str):
     try:
         state = app.state.app_state
         uuid = UUID(job_id)
-        state.queue_manager.cancel_job(uuid)
+        await run_in_threadpool(state.queue_manager.cancel_job, uuid)
         return {"success": True}
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid job ID")
@@ -573,7 +691,7 @@ async def remove_job(job_id: str):
     try:
         state = app.state.app_state
         uuid = UUID(job_id)
-        state.queue_manager.remove_job(uuid)
+        await run_in_threadpool(state.queue_manager.remove_job, uuid)
         return {"success": True}
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid job ID")
@@ -619,9 +737,50 @@ async def update_settings(settings: SettingsUpdate):
     return {"status": "success", "message": "Settings saved successfully"}
 
 
+class SPAStaticFiles(StaticFiles):
+    """Static files that serve the SPA entry (index.html) from memory.
+
+    The build is immutable at runtime, so "/" and client-side routes get the
+    cached bytes instead of a stat + open + read on every page load.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__(directory=directory, html=True)
+        index_file = directory / "index.html"
+        index_stat = index_file.stat()
+        self.index_html = index_file.read_bytes()
+        self.index_headers = {
+            "etag": f'"{index_stat.st_mtime_ns:x}-{index_stat.st_size:x}"',
+            "last-modified": formatdate(index_stat.st_mtime, usegmt=True),
+        }
+
+    def index_response(self, scope: Scope) -> Response:
+        """The cached index.html, or a 304 if the client's copy is current."""
+        response = Response(
+            content=self.index_html, media_type="text/html", headers=self.index_headers
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] in ("GET", "HEAD") and path in (".", "index.html"):
+            return self.index_response(scope)
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            # client-side routes (no file extension) fall back to the SPA entry,
+            # missing assets are still a 404
+            if e.status_code != 404 or Path(path).suffix:
+                raise
+            return self.index_response(scope)
+
+
 # serve frontend static files (for production Docker deployment)
-frontend_build_path = Path(__file__).parent.parent / "frontend_web" / "build"
-if frontend_build_path.exists():
-    app.mount(
-        "/", StaticFiles(directory=frontend_build_path, html=True), name="frontend"
+if frontend_build_exists:
+    static_files = (
+        SPAStaticFiles(frontend_build_path)
+        if (frontend_build_path / "index.html").is_file()
+        else StaticFiles(directory=frontend_build_path, html=True)
     )
+    app.mount("/", static_files, name="frontend")
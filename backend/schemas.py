@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pathlib import Path
+
+from pydantic import BaseModel, Field
 
 from core.logger import LogLevel
 
@@ -13,15 +15,33 @@ class BrowseRequest(BaseModel):
 
 
 class MediaInfoRequest(BaseModel):
-    file_path: str
+    file_path: Path
 
 
 class ExtractChaptersRequest(BaseModel):
-    file_path: str
+    file_path: Path
 
 
 class ReadFileRequest(BaseModel):
-    file_path: str
+    file_path: Path
+
+
+class AudioTrackIn(BaseModel):
+    file_path: str = Field(alias="filePath")
+    language: str | None = None
+    title: str | None = ""
+    delay: int | None = 0
+    is_default: bool = Field(False, alias="isDefault")
+    track_id: int | None = Field(None, alias="trackId")
+
+
+class SubtitleTrackIn(BaseModel):
+    file_path: str = Field(alias="filePath")
+    language: str | None = None
+    title: str | None = ""
+    is_default: bool = Field(False, alias="isDefault")
+    is_forced: bool = Field(False, alias="isForced")
+    track_id: int | None = Field(None, alias="trackId")
 
 
 class AddJobRequest(BaseModel):
@@ -29,8 +49,8 @@ class AddJobRequest(BaseModel):
     video_language: str | None = None
     video_title: str | None = None
     video_delay: int = 0
-    audio_tracks: list[dict] = []
-    subtitle_tracks: list[dict] = []
+    audio_tracks: list[AudioTrackIn] = []
+    subtitle_tracks: list[SubtitleTrackIn] = []
     chapters: str | None = None
     output_file: str
 
@@ -2,15 +2,28 @@ import os
 import platform
 import plistlib
 import shutil
+import stat
 import subprocess
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from subprocess import run
 
 import tomllib
 
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+
+# whitelist of runtime subdirectories to keep in the bundled build
+RUNTIME_WHITELIST = (
+    "images",
+    # add more subdirectories here if needed
+)
+
 
 def get_executable_extension() -> str:
-    return ".exe" if platform.system() == "Windows" else ""
+    return ".exe" if _IS_WINDOWS else ""
 
 
 def load_toml(file_path: Path) -> dict:
@@ -19,13 +32,59 @@ def load_toml(file_path: Path) -> dict:
         return tomllib.load(f)
 
 
+def resize_with_pillow(png_path: Path, variants: list[tuple[int, Path]]) -> None:
+    """
+    Decode the PNG once and resample every icon size in-process.
+    Raises ImportError if Pillow isn't installed.
+    """
+    from PIL import Image
+
+    with Image.open(png_path) as img:
+        src = img.convert("RGBA")
+    for size, output_file in variants:
+        src.resize((size, size), Image.Resampling.LANCZOS).save(output_file, "PNG")
+
+
+def resize_with_sips(png_path: Path, variants: list[tuple[int, Path]]) -> None:
+    """
+    Resize icon variants with sips (macOS built-in tool).
+    Each pixel size is rendered once; variants sharing a size (e.g. 32x32 and
+    16x16@2x) are copied from that render instead of spawning another sips.
+    """
+    by_size: dict[int, list[Path]] = {}
+    for size, output_file in variants:
+        by_size.setdefault(size, []).append(output_file)
+
+    def resize(size: int) -> None:
+        first, *rest = by_size[size]
+        subprocess.run(
+            [
+                "sips",
+                "-z",
+                str(size),
+                str(size),
+                str(png_path),
+                "--out",
+                str(first),
+            ],
+            check=True,
+            capture_output=True,
+        )
+        for output_file in rest:
+            shutil.copyfile(first, output_file)
+
+    # every sips call is its own process, so run them side by side
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(resize, by_size))
+
+
 def create_icns_from_png(png_path: Path, output_icns: Path) -> bool:
     """
-    Convert PNG to ICNS format using sips (macOS built-in tool).
+    Convert PNG to ICNS format using Pillow (falling back to sips) and iconutil.
     Returns True if successful, False otherwise.
     """
     try:
-        if platform.system() != "Darwin":
+        if not _IS_DARWIN:
             print("Warning: ICNS conversion is only supported on macOS")
             return False
 
@@ -35,39 +94,18 @@ def create_icns_from_png(png_path: Path, output_icns: Path) -> bool:
 
         # generate different sizes required for ICNS
         sizes = [16, 32, 64, 128, 256, 512, 1024]
+        variants = []
         for size in sizes:
-            output_file = iconset_dir / f"icon_{size}x{size}.png"
-            subprocess.run(
-                [
-                    "sips",
-                    "-z",
-                    str(size),
-                    str(size),
-                    str(png_path),
-                    "--out",
-                    str(output_file),
-                ],
-                check=True,
-                capture_output=True,
-            )
+            variants.append((size, iconset_dir / f"icon_{size}x{size}.png"))
 
             # create @2x versions for retina displays (except for largest size)
             if size <= 512:
-                retina_size = size * 2
-                output_file_2x = iconset_dir / f"icon_{size}x{size}@2x.png"
-                subprocess.run(
-                    [
-                        "sips",
-                        "-z",
-                        str(retina_size),
-                        str(retina_size),
-                        str(png_path),
-                        "--out",
-                        str(output_file_2x),
-                    ],
-                    check=True,
-                    capture_output=True,
-                )
+                variants.append((size * 2, iconset_dir / f"icon_{size}x{size}@2x.png"))
+
+        try:
+            resize_with_pillow(png_path, variants)
+        except ImportError:
+            resize_with_sips(png_path, variants)
 
         # convert iconset to icns
         subprocess.run(
@@ -86,6 +124,45 @@ def create_icns_from_png(png_path: Path, output_icns: Path) -> bool:
         return False
 
 
+def link_or_copy(src: str | Path, dest: str | Path) -> None:
+    """Hardlink a file (no bytes copied), falling back to a real copy."""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def link_tree(src: Path, dest: Path) -> None:
+    """
+    Recreate a directory tree, hardlinking (or copying) every file into it.
+    Symlinks (e.g. framework Versions/Current) are recreated as symlinks.
+    """
+    for root, dirs, files in os.walk(src):
+        # os.walk is top-down, so each directory's parent already exists
+        target_dir = dest / Path(root).relative_to(src)
+        target_dir.mkdir(exist_ok=True)
+        for name in (*dirs, *files):
+            source = os.path.join(root, name)
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), target_dir / name)
+            elif name in files:
+                link_or_copy(source, target_dir / name)
+
+
+def move_or_link(src: Path, dest: Path) -> None:
+    """
+    Move a file or directory, which is free on the same filesystem.
+    Falls back to hardlinking (or copying) each file if the move fails.
+    """
+    try:
+        os.rename(src, dest)
+    except OSError:
+        if src.is_dir():
+            link_tree(src, dest)
+        else:
+            link_or_copy(src, dest)
+
+
 def create_info_plist(app_name: str, version: str, bundle_identifier: str) -> dict:
     """Create the Info.plist dictionary for the macOS app."""
     return {
@@ -114,7 +191,8 @@ def create_app_bundle(
     icon_path: Path | None = None,
 ) -> Path:
     """
-    Create a macOS .app bundle from PyInstaller output.
+    Create a macOS .app bundle from PyInstaller output, reusing the .app
+    PyInstaller produced when there is one.
 
     Args:
         pyinstaller_output_dir: Path to PyInstaller's dist output directory
@@ -126,36 +204,46 @@ def create_app_bundle(
     Returns:
         Path to the created .app bundle
     """
-    # define .app structure paths
-    app_bundle = pyinstaller_output_dir.parent / f"{app_name}.app"
-    contents_dir = app_bundle / "Contents"
-    macos_dir = contents_dir / "MacOS"
-    resources_dir = contents_dir / "Resources"
-
-    # clean up if it already exists
-    if app_bundle.exists():
-        shutil.rmtree(app_bundle)
-
-    # create directory structure
-    macos_dir.mkdir(parents=True, exist_ok=True)
-    resources_dir.mkdir(parents=True, exist_ok=True)
-
-    print(f"Creating app bundle: {app_bundle}")
-
-    # move PyInstaller contents to MacOS directory
-    # PyInstaller creates a folder with the app name containing the executable and resources
-    pyinstaller_app_dir = pyinstaller_output_dir / app_name
-    if pyinstaller_app_dir.exists():
-        # move everything from the PyInstaller output to MacOS
-        for item in pyinstaller_app_dir.iterdir():
-            dest = macos_dir / item.name
-            if item.is_dir():
-                shutil.copytree(item, dest)
-            else:
-                shutil.copy2(item, dest)
-        print(f"Copied PyInstaller output to MacOS directory")
+    # PyInstaller's --windowed build on macOS already lays out a .app next to
+    # the onedir output; patch that one in place rather than building another
+    pyinstaller_app_bundle = pyinstaller_output_dir / f"{app_name}.app"
+    if pyinstaller_app_bundle.is_dir():
+        app_bundle = pyinstaller_app_bundle
+        contents_dir = app_bundle / "Contents"
+        macos_dir = contents_dir / "MacOS"
+        resources_dir = contents_dir / "Resources"
+        resources_dir.mkdir(parents=True, exist_ok=True)
+        print(f"Updating PyInstaller app bundle: {app_bundle}")
     else:
-        raise FileNotFoundError(f"PyInstaller output not found: {pyinstaller_app_dir}")
+        # define .app structure paths
+        app_bundle = pyinstaller_output_dir.parent / f"{app_name}.app"
+        contents_dir = app_bundle / "Contents"
+        macos_dir = contents_dir / "MacOS"
+        resources_dir = contents_dir / "Resources"
+
+        # clean up if it already exists
+        if app_bundle.exists():
+            shutil.rmtree(app_bundle)
+
+        # create directory structure (the bundle was just removed, so build it
+        # top-down once instead of probing parents for every leaf)
+        os.makedirs(macos_dir)
+        resources_dir.mkdir()
+
+        print(f"Creating app bundle: {app_bundle}")
+
+        # move PyInstaller contents to MacOS directory
+        # PyInstaller creates a folder with the app name containing the executable and resources
+        pyinstaller_app_dir = pyinstaller_output_dir / app_name
+        if pyinstaller_app_dir.exists():
+            # move everything from the PyInstaller output to MacOS
+            for item in pyinstaller_app_dir.iterdir():
+                move_or_link(item, macos_dir / item.name)
+            print(f"Moved PyInstaller output to MacOS directory")
+        else:
+            raise FileNotFoundError(
+                f"PyInstaller output not found: {pyinstaller_app_dir}"
+            )
 
     # handle icon
     icns_path = resources_dir / "AppIcon.icns"
@@ -199,6 +287,59 @@ def create_app_bundle(
 #     return Path(get_location.group(1))
 
 
+def prune_runtime(runtime_dir: Path) -> None:
+    """Remove everything but RUNTIME_WHITELIST subdirectories from a bundled runtime"""
+    # DirEntry caches the file type, so no extra stat per item
+    try:
+        with os.scandir(runtime_dir) as entries:
+            to_remove = [
+                entry
+                for entry in entries
+                if not (
+                    entry.is_dir(follow_symlinks=False)
+                    and entry.name in RUNTIME_WHITELIST
+                )
+            ]
+    except FileNotFoundError:
+        return
+    for entry in to_remove:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+    if to_remove:
+        removed = ", ".join(entry.name for entry in to_remove)
+        print(f"Removed {len(to_remove)} entries from {runtime_dir}: {removed}")
+
+
+def _platform_build_args(
+    dev_runtime: Path, icon_path: Path, desktop_script: Path, work_dir: Path
+) -> list[str]:
+    """PyInstaller onedir (bundle) command for the current platform."""
+    build_args = [
+        "uv",
+        "run",
+        "pyinstaller",
+        "-n",
+        "Mp4Forge",
+        "--distpath",
+        "bundled_mode",
+        "--workpath",
+        str(work_dir),
+        f"--add-data={dev_runtime}:runtime",
+        "--contents-directory",
+        "bundle",
+        "--windowed",
+    ]
+
+    # only add icon on Windows/Linux; macOS uses .icns which is added during .app bundle creation
+    if not _IS_DARWIN:
+        build_args.append(f"--icon={str(icon_path)}")
+
+    build_args.extend(["-y", str(desktop_script)])
+    return build_args
+
+
 def build_app():
     # change directory to the project's root directory
     project_root = Path(__file__).parent
@@ -215,6 +356,16 @@ def build_app():
     desktop_script = Path(project_root / "frontend_desktop" / "main.py")
     icon_path = Path(dev_runtime / "images" / "mp4.ico")
 
+    # on macOS, build the .icns in the background while PyInstaller runs
+    icon_png = dev_runtime / "images" / "mp4.png"
+    icns_path = pyinstaller_folder / "AppIcon.icns"
+    icns_future: Future[bool] | None = None
+    if _IS_DARWIN and icon_png.exists():
+        icns_executor = ThreadPoolExecutor(max_workers=1)
+        icns_future = icns_executor.submit(create_icns_from_png, icon_png, icns_path)
+        # already submitted work still runs to completion
+        icns_executor.shutdown(wait=False)
+
     # get extra deps
     # site_packages = get_site_packages()
 
@@ -236,47 +387,33 @@ def build_app():
     #     ]
     # )
 
-    # run pyinstaller onedir (bundle) build
-    # Build command args - skip icon on macOS as it will be added during .app bundle creation
-    build_args = [
-        "uv",
-        "run",
-        "pyinstaller",
-        "-n",
-        "Mp4Forge",
-        "--distpath",
-        "bundled_mode",
-        f"--add-data={dev_runtime}:runtime",
-        "--contents-directory",
-        "bundle",
-        "--windowed",
-    ]
-
-    # only add icon on Windows/Linux; macOS uses .icns which is added during .app bundle creation
-    if platform.system() != "Darwin":
-        build_args.append(f"--icon={str(icon_path)}")
+    # keep PyInstaller's cache and intermediate work files in the system temp dir
+    # (tmpfs on most Linux hosts), unique per process so parallel builds don't collide
+    pyi_temp = Path(tempfile.gettempdir())
+    pyi_config_dir = pyi_temp / f"pyi-config-{os.getpid()}"
+    pyi_work_dir = pyi_temp / f"pyi-work-{os.getpid()}"
+    build_env = {**os.environ, "PYINSTALLER_CONFIG_DIR": str(pyi_config_dir)}
 
-    build_args.extend(["-y", str(desktop_script)])
+    # run pyinstaller onedir (bundle) build
+    build_args = _platform_build_args(
+        dev_runtime, icon_path, desktop_script, pyi_work_dir
+    )
 
-    build_job_onedir = run(build_args)
+    try:
+        build_job_onedir = run(build_args, env=build_env)
+    finally:
+        shutil.rmtree(pyi_work_dir, ignore_errors=True)
+        shutil.rmtree(pyi_config_dir, ignore_errors=True)
 
     # cleanse included runtime folder of unneeded files
-    # whitelist of runtime subdirectories to keep in the bundled build
-    RUNTIME_WHITELIST = (
-        "images",
-        # add more subdirectories here if needed
-    )
-
     # bundled_runtime = Path(desktop_script.parent / "bundle" / "runtime")
     bundled_runtime = Path("bundled_mode") / "Mp4Forge" / "bundle" / "runtime"
-    if bundled_runtime.exists():
-        for item in bundled_runtime.iterdir():
-            if item.is_dir() and item.name not in RUNTIME_WHITELIST:
-                shutil.rmtree(item)
-                print(f"Removed: {item.name}")
-            elif item.is_file():
-                item.unlink()
-                print(f"Removed: {item.name}")
+    prune_runtime(bundled_runtime)
+    # on macOS PyInstaller also lays out its own copy of the data in the .app
+    if _IS_DARWIN:
+        prune_runtime(
+            Path("bundled_mode") / "Mp4Forge.app" / "Contents" / "Resources" / "runtime"
+        )
 
     exe_str = get_executable_extension()
     success_msgs = []
@@ -290,7 +427,12 @@ def build_app():
 
     # check onedir (bundle) build
     onedir_path = Path("bundled_mode") / "Mp4Forge" / f"Mp4Forge{exe_str}"
-    build_succeeded = onedir_path.is_file() and str(build_job_onedir.returncode) == "0"
+    try:
+        build_succeeded = build_job_onedir.returncode == 0 and stat.S_ISREG(
+            os.stat(onedir_path).st_mode
+        )
+    except FileNotFoundError:
+        build_succeeded = False
 
     if build_succeeded:
         success_msgs.append(f"Bundle build success! Path: {Path.cwd() / onedir_path}")
@@ -304,22 +446,23 @@ def build_app():
     os.chdir(desktop_script.parent)
 
     # on macOS, create a proper .app bundle
-    if platform.system() == "Darwin" and build_succeeded:
+    if _IS_DARWIN and build_succeeded:
         try:
             # get version from pyproject.toml
             pyproject_path = project_root / "pyproject.toml"
             pyproject = load_toml(pyproject_path)
             version = pyproject["project"]["version"]
 
-            # create .app bundle (pyinstaller_output already defined above)
-            icon_png = project_root / "runtime" / "images" / "mp4.png"
+            # wait for the background icon build, the bundle just copies the .icns
+            icns_ready = icns_future is not None and icns_future.result()
 
+            # create .app bundle (pyinstaller_output already defined above)
             app_bundle = create_app_bundle(
                 pyinstaller_output_dir=pyinstaller_output,
                 app_name="Mp4Forge",
                 version=version,
                 bundle_identifier="io.github.jessielw.mp4forge",
-                icon_path=icon_png if icon_png.exists() else None,
+                icon_path=icns_path if icns_ready else None,
             )
             success_msgs.append(f"macOS app bundle created: {app_bundle}")
         except Exception as e:
@@ -1,16 +1,23 @@
+import copy
+import os
 import shutil
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import tomlkit
+import tomli_w
+import tomllib
 from dotenv import load_dotenv
-from tomlkit.toml_document import TOMLDocument
 
 from core.__version__ import __version__
 from core.logger import LogLevel
 from core.utils.working_dir import CONFIG_DIR
 
-load_dotenv()
+# config string (upper-cased) -> LogLevel
+_LEVEL_MAP = {level.name: level for level in LogLevel}
+
+# seconds after a change before it's written to disk (changes in between coalesce)
+SAVE_DELAY = 1.0
 
 
 class Config:
@@ -19,60 +26,114 @@ class Config:
     # increment when breaking changes are made
     CONFIG_VERSION = 1
 
+    # written above the TOML body on save (tomli_w doesn't emit comments)
+    HEADER = "# MP4 Mux Tool Configuration\n\n"
+
+    # parsed config files keyed by path -> (mtime_ns, size, parsed dict)
+    _parse_cache: dict[Path, tuple[int, int, dict[str, dict[str, Any]]]] = {}
+
     def __init__(self, config_path: Path | None = None) -> None:
         self.config_path = config_path or CONFIG_DIR / "config.toml"
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        self._config: TOMLDocument = self._load()
+        self._config: dict[str, dict[str, Any]] = self._load()
+        # flat (section, key) view of _config so reads are a single dict lookup
+        self._flat: dict[tuple[str, str], Any] = {
+            (section, key): value
+            for section, table in self._config.items()
+            if isinstance(table, dict)
+            for key, value in table.items()
+        }
+        # set when values change, cleared once they're written to disk
+        self._dirty = False
+        # pending delayed save, and a lock so it can't write while values change
+        self._save_timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+        # resolved log level and MP4Box path, cleared whenever the setting changes
+        self._log_level: LogLevel | None = None
+        self._mp4box_path: str | None = None
 
         # instance variables for easy access
         self.version = str(__version__)
 
-    def _load(self) -> TOMLDocument:
-        """Load configuration from file or create default"""
-        if self.config_path.exists():
-            with open(self.config_path, encoding="utf-8") as f:
-                doc = tomlkit.load(f)
-
-            # check config version compatibility
-            config_version = doc.get("general", {}).get("config_version", 0)
-            if config_version != self.CONFIG_VERSION:
-                # version mismatch - backup old config and create new one
-                backup_path = self.config_path.with_suffix(
-                    f".toml.v{config_version}.bak"
-                )
-                self.config_path.rename(backup_path)
-                return self._create_default()
-
-            return doc
-        return self._create_default()
-
-    def _create_default(self) -> TOMLDocument:
-        """Create default configuration"""
-        doc = tomlkit.document()
-        doc.add(tomlkit.comment("MP4 Mux Tool Configuration"))
-        doc.add(tomlkit.nl())
-
-        # general settings
-        general = tomlkit.table()
-        general.add("config_version", self.CONFIG_VERSION)
-        general.add("log_level", "INFO")
-        general.add("theme", "Auto")
-        general.add("mp4box_path", "")
-
-        doc.add("general", general)
-
-        # output settings
-        output = tomlkit.table()
-        output.add("add_and_clear", True)
-
-        doc.add("output", output)
+        # first run (or an incompatible config was backed up), write the defaults
+        if not self.config_path.exists():
+            self._dirty = True
+            self.save()
 
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load configuration from file or create default"""
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            return self._create_default()
+
+        # skip the TOML parse if the file hasn't changed since it was last read
+        cached = self._parse_cache.get(self.config_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(cached[2])
+
+        with open(self.config_path, "rb") as f:
+            doc = tomllib.load(f)
+
+        # check config version compatibility
+        config_version = doc.get("general", {}).get("config_version", 0)
+        if config_version != self.CONFIG_VERSION:
+            # version mismatch - backup old config and create new one
+            backup_path = self.config_path.with_suffix(f".toml.v{config_version}.bak")
+            self.config_path.rename(backup_path)
+            return self._create_default()
+
+        self._parse_cache[self.config_path] = (
+            st.st_mtime_ns,
+            st.st_size,
+            copy.deepcopy(doc),
+        )
         return doc
 
+    def _create_default(self) -> dict[str, dict[str, Any]]:
+        """Create default configuration"""
+        return {
+            # general settings
+            "general": {
+                "config_version": self.CONFIG_VERSION,
+                "log_level": "INFO",
+                "theme": "Auto",
+                "mp4box_path": "",
+            },
+            # output settings
+            "output": {
+                "add_and_clear": True,
+            },
+        }
+
     def save(self) -> None:
-        """Save configuration to file"""
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            tomlkit.dump(self._config, f)
+        """Save configuration to file (no-op if nothing changed since last save)"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            # write to a sibling temp file and swap it in, so a crash mid-write
+            # can never leave a truncated config.toml behind
+            tmp_path = self.config_path.with_suffix(".toml.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(self.HEADER.encode("utf-8"))
+                tomli_w.dump(self._config, f)
+            os.replace(tmp_path, self.config_path)
+            self._dirty = False
+
+    def flush(self) -> None:
+        """Write any pending changes to disk (call on shutdown)"""
+        self.save()
+
+    def _schedule_save(self) -> None:
+        """Save SAVE_DELAY seconds from now, unless a save is already pending"""
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(SAVE_DELAY, self.save)
+            # a pending save must not keep the process alive, flush() covers exit
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get configuration value from specified section
@@ -82,7 +143,7 @@ class Config:
             key: Configuration key to retrieve
             default: Default value if key not found
         """
-        return self._config.get(section, {}).get(key, default)
+        return self._flat.get((section, key), default)
 
     def set(self, section: str, key: str, value: Any) -> None:
         """Set configuration value in specified section
@@ -92,23 +153,25 @@ class Config:
             key: Configuration key to set
             value: Value to set
         """
-        if section not in self._config:
-            self._config[section] = tomlkit.table()
-        self._config[section][key] = value  # pyright: ignore[reportIndexIssue]
+        with self._lock:
+            self._config.setdefault(section, {})[key] = value
+            self._flat[(section, key)] = value
+            self._dirty = True
+            self._schedule_save()
 
     @property
     def log_level(self) -> LogLevel:
         """Get log level as enum"""
-        level_str = self.get("general", "log_level", "INFO")
-        try:
-            return LogLevel[level_str.upper()]
-        except KeyError:
-            return LogLevel.INFO
+        if self._log_level is None:
+            level_str = self.get("general", "log_level", "INFO")
+            self._log_level = _LEVEL_MAP.get(level_str.upper(), LogLevel.INFO)
+        return self._log_level
 
     @log_level.setter
     def log_level(self, value: LogLevel) -> None:
         """Set log level from enum"""
         self.set("general", "log_level", str(value))
+        self._log_level = None
 
     @property
     def theme(self) -> str:
@@ -122,7 +185,19 @@ class Config:
 
     @property
     def mp4box_path(self) -> str:
-        """Get MP4Box executable path"""
+        """Get MP4Box executable path (resolved once, then cached)"""
+        if self._mp4box_path is None:
+            self._mp4box_path = self._resolve_mp4box_path()
+        return self._mp4box_path
+
+    @mp4box_path.setter
+    def mp4box_path(self, value: str) -> None:
+        """Set MP4Box executable path"""
+        self.set("general", "mp4box_path", value)
+        self._mp4box_path = None
+
+    def _resolve_mp4box_path(self) -> str:
+        """Validate the stored MP4Box path or auto-detect it on PATH"""
         stored_path = self.get("general", "mp4box_path", "")
 
         # if empty or doesn't exist, try to auto-detect
@@ -136,11 +211,6 @@ class Config:
 
         return stored_path
 
-    @mp4box_path.setter
-    def mp4box_path(self, value: str) -> None:
-        """Set MP4Box executable path"""
-        self.set("general", "mp4box_path", value)
-
     @property
     def output_add_and_clear(self) -> bool:
         """Get 'add and clear' checkbox state for output tab"""
@@ -218,4 +288,24 @@ class Config:
         return False
 
 
-Conf = Config()
+_conf: Config | None = None
+
+
+def get_conf() -> Config:
+    """Return the shared Config, loading .env and the config file on first use"""
+    global _conf
+    if _conf is None:
+        load_dotenv()
+        _conf = Config()
+    return _conf
+
+
+if TYPE_CHECKING:
+    Conf: Config
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the Conf singleton lazily (PEP 562)"""
+    if name == "Conf":
+        return get_conf()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class JobStatus(Enum):
+class JobStatus(IntEnum):
     """Status of a muxing job"""
 
     QUEUED = auto()
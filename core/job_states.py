@@ -4,14 +4,63 @@ These are pure data structures with no UI dependencies,
 suitable for both desktop and web front-ends.
 """
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from iso639 import Language
 
+# per-field conversions for serialization, every other field is stored as-is
+_SERIALIZE: dict[str, Callable[[Any], Any]] = {
+    "input_file": str,
+    # stored as its ISO 639-3 code
+    "language": lambda language: language.part3 if language else None,
+}
+
+
+@cache
+def _serialized_fields(
+    cls: type,
+) -> tuple[tuple[str, Callable[[Any], Any] | None], ...]:
+    """(name, conversion) for each field to_dict() writes.
+
+    init=False fields are derived from the others, so they aren't serialized.
+    """
+    return tuple((f.name, _SERIALIZE.get(f.name)) for f in fields(cls) if f.init)
+
+
+class _SerializableState:
+    """Mixin providing to_dict() for the slotted state dataclasses below."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        data = {}
+        for name, convert in _serialized_fields(type(self)):
+            value = getattr(self, name)
+            data[name] = convert(value) if convert else value
+        return data
+
 
 @dataclass(frozen=True, slots=True)
-class VideoState:
+class _TrackState(_SerializableState):
+    """Base for track states, caching the ISO 639-3 code of the track's language."""
+
+    # ISO 639-3 code of language, filled in on construction
+    lang3: str | None = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # frozen dataclass, so bypass __setattr__ to fill the cached field
+        object.__setattr__(
+            self, "lang3", self.language.part3 if self.language else None
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class VideoState(_TrackState):
     """Video track state for muxing."""
 
     input_file: Path
@@ -19,18 +68,9 @@ class VideoState:
     title: str = ""
     delay_ms: int = 0
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "input_file": str(self.input_file),
-            "language": self.language.part3 if self.language else None,
-            "title": self.title,
-            "delay_ms": self.delay_ms,
-        }
-
 
 @dataclass(frozen=True, slots=True)
-class AudioState:
+class AudioState(_TrackState):
     """Audio track state for muxing."""
 
     input_file: Path
@@ -40,20 +80,9 @@ class AudioState:
     default: bool = False
     track_id: int | None = None  # for multi-track MP4 inputs
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "input_file": str(self.input_file),
-            "language": self.language.part3 if self.language else None,
-            "title": self.title,
-            "delay_ms": self.delay_ms,
-            "default": self.default,
-            "track_id": self.track_id,
-        }
-
 
 @dataclass(frozen=True, slots=True)
-class SubtitleState:
+class SubtitleState(_TrackState):
     """Subtitle track state for muxing."""
 
     input_file: Path
@@ -63,26 +92,9 @@ class SubtitleState:
     forced: bool = False
     track_id: int | None = None  # for multi-track MP4 inputs
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "input_file": str(self.input_file),
-            "language": self.language.part3 if self.language else None,
-            "title": self.title,
-            "default": self.default,
-            "forced": self.forced,
-            "track_id": self.track_id,
-        }
-
 
 @dataclass(frozen=True, slots=True)
-class ChapterState:
+class ChapterState(_SerializableState):
     """Chapter state for muxing."""
 
     chapters: str | None = None
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "chapters": self.chapters,
-        }
@@ -1,5 +1,7 @@
 import logging
+import os
 import sys
+from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
 from logging.handlers import RotatingFileHandler
@@ -44,6 +46,10 @@ class LogSource(Enum):
     BE = "[BE]"
 
 
+def _noop() -> None:
+    pass
+
+
 class Logger:
     SRC = LogSource
     LVL = LogLevel
@@ -63,6 +69,8 @@ class Logger:
         self.console_handler = None
         self.to_console = to_console
         self.default_source = default_source
+        # handlers are created on the first emitted record, then this becomes a no-op
+        self._ensure_handlers: Callable[[], None] = self._initialize_file_handler
 
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -91,65 +99,66 @@ class Logger:
             )
             self.logger.addHandler(self.console_handler)
 
+        self._ensure_handlers = _noop
+
         # log initial program info on first initialization
         self.info(f"{program_name} v{__version__}")
 
+    def _log(
+        self,
+        level: int,
+        message: str,
+        source: LogSource | None,
+        exc_info: bool = False,
+    ) -> None:
+        # bail out before touching handlers or formatting if the level is filtered
+        if not self.logger.isEnabledFor(level):
+            return
+        self._ensure_handlers()
+        src = source or self.default_source
+        # %-style args defer building the final record text to the handlers
+        self.logger.log(
+            level, "%s: %s", src.value, str(message).strip(), exc_info=exc_info
+        )
+
     def debug(self, message: str, source: LogSource | None = None) -> None:
-        if self.logger.level <= logging.DEBUG:
-            self._initialize_file_handler()
-            src = source or self.default_source
-            self.logger.debug(f"{src.value}: {str(message).strip()}")
+        self._log(logging.DEBUG, message, source)
 
     def info(self, message: str, source: LogSource | None = None) -> None:
-        if self.logger.level <= logging.INFO:
-            self._initialize_file_handler()
-            src = source or self.default_source
-            self.logger.info(f"{src.value}: {str(message).strip()}")
+        self._log(logging.INFO, message, source)
 
     def warning(self, message: str, source: LogSource | None = None) -> None:
-        if self.logger.level <= logging.WARNING:
-            self._initialize_file_handler()
-            src = source or self.default_source
-            self.logger.warning(f"{src.value}: {str(message).strip()}")
+        self._log(logging.WARNING, message, source)
 
     def error(self, message: str, source: LogSource | None = None) -> None:
-        if self.logger.level <= logging.ERROR:
-            self._initialize_file_handler()
-            src = source or self.default_source
-            self.logger.error(f"{src.value}: {str(message).strip()}")
+        self._log(logging.ERROR, message, source)
 
     def critical(self, message: str, source: LogSource | None = None) -> None:
-        if self.logger.level <= logging.CRITICAL:
-            self._initialize_file_handler()
-            src = source or self.default_source
-            self.logger.critical(f"{src.value}: {str(message).strip()}")
+        self._log(logging.CRITICAL, message, source)
 
     def exception(self, message: str, source: LogSource | None = None) -> None:
         """Log exception with traceback (use within except block)"""
-        if self.logger.level <= logging.ERROR:
-            self._initialize_file_handler()
-            src = source or self.default_source
-            self.logger.exception(f"{src.value}: {str(message).strip()}")
+        self._log(logging.ERROR, message, source, exc_info=True)
+
+    def is_enabled_for(self, log_level: LogLevel) -> bool:
+        """Whether messages at this level would currently be logged"""
+        return self.logger.isEnabledFor(log_level.value)
 
     def set_log_level(self, log_level: LogLevel) -> None:
         self.logger.setLevel(log_level.value)
 
     def clean_up_logs(self, max_logs: int) -> None:
-        log_files = list(self.log_file.parent.glob("*.log"))
+        with os.scandir(self.log_file.parent) as entries:
+            log_files = [e for e in entries if e.name.endswith(".log")]
         total_files = len(log_files)
 
-        # sort log files by extracting the timestamp part of the filename
-        log_files.sort(
-            key=lambda f: datetime.strptime(
-                f.name.split("_")[1] + "_" + f.name.split("_")[2], "%Y-%m-%d_%H-%M-%S"
-            )
-        )
-
         if total_files > max_logs:
+            # oldest first, by modification time
+            log_files.sort(key=lambda e: e.stat().st_mtime)
             files_to_delete = log_files[: total_files - max_logs]
 
             for del_file in files_to_delete:
-                del_file.unlink()
+                os.unlink(del_file.path)
 
 
 _date_time_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
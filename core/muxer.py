@@ -1,17 +1,147 @@
+import asyncio
+import atexit
+import hashlib
+import os
 import platform
+import re
+import shlex
+import shutil
+import signal
 import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-import psutil
-
-from core.config import Conf
+from core.config import get_conf
 from core.enums.job_status import JobStatus
-from core.logger import LOG
+from core.logger import LOG, LogLevel
 from core.payloads.mux_job import MuxJob
-from core.queue_manager import QueueManager
+from core.queue_manager import QueueCallback, QueueManager
+
+# minimum seconds between progress updates (the UI doesn't need more than ~10/s)
+PROGRESS_EMIT_INTERVAL = 0.1
+# trailing MP4Box output lines kept for the failure message
+MAX_ERROR_OUTPUT_LINES = 200
+# bytes read from MP4Box's output per read
+OUTPUT_READ_SIZE = 64 * 1024
+# output line breaks ("\r" for in-place progress updates)
+_LINE_BREAK_RE = re.compile(rb"[\r\n]")
+# MP4Box progress lines: "Import: |====| (XX/100)" or "ISO File Writing: |====| (XX/100)"
+_PROGRESS_LINE_RE = re.compile(rb"Import:|Importing ISO File:|ISO File Writing:")
+# the counter follows the last "(" on the line (track names can contain parens)
+_PROGRESS_RE = re.compile(rb"\s*(\d+)\s*/")
+
+# create subprocesses with no window on Windows (Popen copies the STARTUPINFO),
+# each in its own process group so the whole tree can be killed on cancel
+# (POSIX gets the same via start_new_session=True)
+IS_WINDOWS = platform.system() == "Windows"
+if IS_WINDOWS:
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+    _CREATIONFLAGS = subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+    # subprocesses need a proactor loop (uvicorn's selector loop can't spawn them)
+    _LOOP_FACTORY = asyncio.ProactorEventLoop
+else:
+    _STARTUPINFO = None
+    _CREATIONFLAGS = 0
+    _LOOP_FACTORY = asyncio.new_event_loop
+
+
+# one event loop supervises every mux started from a plain thread
+_mux_loop: asyncio.AbstractEventLoop | None = None
+_mux_loop_lock = threading.Lock()
+
+
+def _get_mux_loop() -> asyncio.AbstractEventLoop:
+    """The shared mux event loop, started on a daemon thread on first use"""
+    global _mux_loop
+    with _mux_loop_lock:
+        if _mux_loop is None:
+            _mux_loop = _LOOP_FACTORY()
+            threading.Thread(
+                target=_mux_loop.run_forever, name="mux-loop", daemon=True
+            ).start()
+        return _mux_loop
+
+
+# chapter files shared by the running jobs in this process, named by content hash
+_CHAPTERS_DIR = Path(tempfile.gettempdir()) / f"mp4forge_chapters_{os.getpid()}"
+_chapters_dir_lock = threading.Lock()
+_chapters_dir_ready = False
+# running jobs using each chapter file
+_chapters_refs: dict[Path, int] = {}
+
+
+def _acquire_chapters_file(chapters: str) -> Path:
+    """
+    Path of a file holding these chapters, written only if no running job uses
+    the same text already (jobs often share a chapter template). Every call
+    must be paired with _release_chapters_file().
+    """
+    global _chapters_dir_ready
+    data = chapters.encode("utf-8")
+    path = _CHAPTERS_DIR / f"{hashlib.blake2b(data, digest_size=8).hexdigest()}.txt"
+    with _chapters_dir_lock:
+        if not _chapters_dir_ready:
+            _CHAPTERS_DIR.mkdir(exist_ok=True)
+            # anything left behind by a crashed job
+            atexit.register(shutil.rmtree, _CHAPTERS_DIR, ignore_errors=True)
+            _chapters_dir_ready = True
+        if path not in _chapters_refs:
+            # closed before MP4Box can read it (Windows file locking)
+            path.write_bytes(data)
+            _chapters_refs[path] = 0
+        _chapters_refs[path] += 1
+    return path
+
+
+def _release_chapters_file(path: Path) -> None:
+    """Drop a job's use of a chapter file, deleting it after the last one"""
+    with _chapters_dir_lock:
+        _chapters_refs[path] -= 1
+        if _chapters_refs[path]:
+            return
+        del _chapters_refs[path]
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+async def _output_lines(stream: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """Non-empty lines of a process's output, split on "\r" or "\n"
+
+    Read in chunks rather than with StreamReader.readline(), which fails on
+    lines longer than the stream's 64 KiB limit.
+    """
+    pending = b""
+    while chunk := await stream.read(OUTPUT_READ_SIZE):
+        *lines, pending = _LINE_BREAK_RE.split(pending + chunk)
+        for line in lines:
+            if line:
+                yield line
+    if pending:
+        yield pending
+
+
+def _track_opts(selector: str, lang3: str | None, title: str, *extra: str) -> str:
+    """MP4Box -add options for a track, :lang=/:name= are always set (or cleared)"""
+    return "".join((selector, f":lang={lang3 or ''}", f":name={title or ''}", *extra))
+
+
+def _default_opts(is_default: bool, any_default: bool, group: int) -> str:
+    """Default track flags, other tracks in the group are explicitly not default"""
+    if is_default:
+        return f":tkhd=3:group={group}"
+    if any_default:
+        return f":tkhd=0:group={group}"
+    return ""
 
 
 class ProgressCallback:
@@ -27,399 +157,327 @@ class ProgressCallback:
         pass
 
 
+class _CancelSignal(QueueCallback):
+    """Sets an asyncio.Event on the current loop once the job is cancelled"""
+
+    def __init__(self, job: MuxJob) -> None:
+        self.job = job
+        self.loop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+
+    def on_job_status_changed(self, job: MuxJob) -> None:
+        # called from whichever thread changed the status
+        if job.job_id == self.job.job_id and job.cancel_event.is_set():
+            try:
+                self.loop.call_soon_threadsafe(self.event.set)
+            except RuntimeError:
+                # loop closed, nothing is waiting anymore
+                pass
+
+
 class VideoMuxer:
     """Pure business logic - works with ANY frontend"""
 
     def __init__(self, progress_callback: Optional[ProgressCallback] = None) -> None:
         self.progress_callback = progress_callback
         self.queue_manager = QueueManager()
-        # track processes by job_id
-        self.active_processes: dict[UUID, subprocess.Popen] = {}
+        # track processes by job_id (shared by concurrent QueueManager.run workers)
+        self.active_processes: dict[UUID, asyncio.subprocess.Process] = {}
+        self._processes_lock = threading.Lock()
 
     def mux_from_job(self, job: MuxJob) -> None:
-        """Process a MuxJob from the queue"""
-        # self._mock_mux_with_ping(job)
-        LOG.debug(f"Mux job: {job}")
-        self._mux_with_mp4box(job)
-
-    def _mock_mux_with_ping(self, job: MuxJob):
-        """Mock processing with ping for testing GUI controls"""
-        process = None
-        try:
-            self.queue_manager.update_job_status(job.job_id, JobStatus.PROCESSING)
-
-            # Check if job was cancelled before starting
-            current_job = self.queue_manager.get_job(job.job_id)
-            if current_job and current_job.status == JobStatus.CANCELLED:
-                return
-
-            # Mock processing with ping (50 pings)
-            # On Windows: ping -n 50 127.0.0.1
-            # On Unix: ping -c 50 127.0.0.1
-            is_windows = platform.system() == "Windows"
-            if is_windows:
-                cmd = ["ping", "-n", "20", "127.0.0.1"]
-            else:
-                cmd = ["ping", "-c", "20", "127.0.0.1"]
-
-            # Create subprocess with no window on Windows
-            startupinfo = None
-            if is_windows:
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                startupinfo=startupinfo,
-                creationflags=subprocess.CREATE_NO_WINDOW if is_windows else 0,
-            )
-
-            # Store process for potential cancellation
-            self.active_processes[job.job_id] = process
-
-            # Parse ping output for progress
-            ping_count = 0
-            total_pings = 20
-
-            assert process.stdout is not None  # Created with stdout=PIPE
-            for line in process.stdout:
-                # Check if job was cancelled
-                current_job = self.queue_manager.get_job(job.job_id)
-                if current_job and current_job.status == JobStatus.CANCELLED:
-                    self._kill_process(process)
-                    return
-
-                # Count successful pings (look for "Reply from" or "bytes from")
-                if "reply from" in line.lower() or "bytes from" in line.lower():
-                    ping_count += 1
-                    percent = (ping_count / total_pings) * 100
-                    message = f"Processing ping {ping_count}/{total_pings}"
-
-                    self._notify_progress(percent, message)
-                    self.queue_manager.update_job_progress(job.job_id, percent, message)
-
-            # Wait for process to complete
-            return_code = process.wait()
-
-            # Clean up process tracking
-            self.active_processes.pop(job.job_id, None)
-
-            # Check final status
-            current_job = self.queue_manager.get_job(job.job_id)
-            if current_job and current_job.status == JobStatus.CANCELLED:
-                return
-
-            if return_code == 0:
-                self.queue_manager.update_job_status(job.job_id, JobStatus.COMPLETED)
-                self._notify_complete(str(job.output_file))
-            else:
-                stderr = process.stderr.read() if process.stderr else "Unknown error"
-                self.queue_manager.update_job_status(
-                    job.job_id, JobStatus.FAILED, stderr
+        """Process a MuxJob from the queue (blocks until it's done)"""
+        asyncio.run_coroutine_threadsafe(
+            self._mux_with_mp4box_async(job), _get_mux_loop()
+        ).result()
+
+    async def mux_from_job_async(self, job: MuxJob) -> None:
+        """Process a MuxJob from the queue on the caller's event loop"""
+        if IS_WINDOWS and not isinstance(
+            asyncio.get_running_loop(), asyncio.ProactorEventLoop
+        ):
+            # a selector loop can't run subprocesses, use the (proactor) mux loop
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(
+                    self._mux_with_mp4box_async(job), _get_mux_loop()
                 )
-                self._notify_error(stderr)
-
-        except Exception as e:
-            error_msg = str(e)
-            self.queue_manager.update_job_status(
-                job.job_id, JobStatus.FAILED, error_msg
             )
-            self._notify_error(error_msg)
-        finally:
-            # Clean up process if still running
-            if process and process.poll() is None:
-                self._kill_process(process)
-            self.active_processes.pop(job.job_id, None)
+            return
+        await self._mux_with_mp4box_async(job)
 
-    def _mux_with_mp4box(self, job: MuxJob) -> None:
+    async def _mux_with_mp4box_async(self, job: MuxJob) -> None:
         """MP4Box muxing implementation."""
         process = None
+        cancel_watcher = None
+        chapters_file = None
+        # set when the job is cancelled, so a running process is killed at once
+        cancel_signal = _CancelSignal(job)
+        self.queue_manager.register_callback(cancel_signal)
+        # checked once per job, debug output (job repr, command line, MP4Box
+        # output) is only formatted when it will actually be logged
+        log_output = LOG.is_enabled_for(LogLevel.DEBUG)
+        if log_output:
+            LOG.debug(f"Mux job: {job}")
 
         try:
             # validate MP4Box exists before starting
-            mp4box_path = Conf.mp4box_path
+            mp4box_path = get_conf().mp4box_path
             if not mp4box_path:
                 error_msg = (
                     f"MP4Box not found at '{mp4box_path}'. Please install "
                     "MP4Box or update the path in settings."
                 )
-                self.queue_manager.update_job_status(
-                    job.job_id, JobStatus.FAILED, error_msg
-                )
-                self._notify_error(error_msg)
+                await self._set_status(job, JobStatus.FAILED, error_msg)
+                await asyncio.to_thread(self._notify_error, error_msg)
                 return
 
-            self.queue_manager.update_job_status(job.job_id, JobStatus.PROCESSING)
-
             # check if job was cancelled before starting
-            current_job = self.queue_manager.get_job(job.job_id)
-            if current_job and current_job.status == JobStatus.CANCELLED:
+            if job.cancel_event.is_set():
                 return
 
+            await self._set_status(job, JobStatus.PROCESSING)
+
             # build MP4Box command
-            cmd = [Conf.mp4box_path]
+            cmd = [mp4box_path]
+            output_file = str(job.output_file)
 
             # add video track
             if job.video:
-                video_opts = "#video"
-                # always add :lang= to explicitly set or clear language
-                if job.video.language:
-                    video_opts += f":lang={job.video.language.part3}"
-                else:
-                    video_opts += ":lang="
-                video_opts += (
-                    f":name={job.video.title}" if job.video.title else ":name="
-                )
-                video_opts += (
-                    f":delay={job.video.delay_ms}"
-                    if job.video.delay_ms != 0
-                    else ":delay="
+                video = job.video
+                # always add :delay= too, to explicitly set or clear it
+                video_opts = _track_opts(
+                    "#video", video.lang3, video.title, f":delay={video.delay_ms or ''}"
                 )
-                cmd.extend(["-add", f"{job.video.input_file}{video_opts}"])
+                cmd.extend(["-add", f"{video.input_file}{video_opts}"])
 
             # add audio tracks
             audio_defaults_set = any(audio.default for audio in job.audio_tracks)
             for audio in job.audio_tracks:
-                # use specific track_id if provided (for multi-track MP4), otherwise use #audio
-                if audio.track_id is not None:
-                    audio_opts = f"#{audio.track_id}"
-                else:
-                    audio_opts = "#audio"
-
-                # always add :lang= to explicitly set or clear language
-                if audio.language:
-                    audio_opts += f":lang={audio.language.part3}"
-                else:
-                    audio_opts += ":lang="
-                audio_opts += f":name={audio.title}" if audio.title else ":name="
-                if audio.delay_ms != 0:
-                    audio_opts += f":delay={audio.delay_ms}"
-
-                # default flag logic
-                if audio.default:
-                    audio_opts += ":tkhd=3:group=1"
-                elif audio_defaults_set:
-                    # explicitly disable default if another track is default
-                    audio_opts += ":tkhd=0:group=1"
-
+                audio_opts = _track_opts(
+                    # use specific track_id if provided (for multi-track MP4), otherwise use #audio
+                    f"#{audio.track_id}" if audio.track_id is not None else "#audio",
+                    audio.lang3,
+                    audio.title,
+                    f":delay={audio.delay_ms}" if audio.delay_ms != 0 else "",
+                    _default_opts(audio.default, audio_defaults_set, 1),
+                )
                 cmd.extend(["-add", f"{audio.input_file}{audio_opts}"])
 
             # add subtitle tracks with default/forced logic
             subtitle_defaults_set = any(sub.default for sub in job.subtitle_tracks)
             for subtitle in job.subtitle_tracks:
-                # determine track selector (for multi-track MP4 inputs)
-                if subtitle.track_id is not None:
-                    track_selector = f"#{subtitle.track_id}"
-                else:
-                    track_selector = "#text"  # default to first text track
-
-                subtitle_opts = track_selector
-                # always add :lang= to explicitly set or clear language
-                if subtitle.language:
-                    subtitle_opts += f":lang={subtitle.language.part3}"
-                else:
-                    subtitle_opts += ":lang="
-                subtitle_opts += (
-                    f":name={subtitle.title}" if subtitle.title else ":name="
+                subtitle_opts = _track_opts(
+                    # track selector for multi-track MP4 inputs, else the first text track
+                    f"#{subtitle.track_id}"
+                    if subtitle.track_id is not None
+                    else "#text",
+                    subtitle.lang3,
+                    subtitle.title,
+                    _default_opts(subtitle.default, subtitle_defaults_set, 2),
+                    # forced flag
+                    ":txtflags=0xC0000000" if subtitle.forced else "",
                 )
-
-                # default flag logic
-                if subtitle.default:
-                    subtitle_opts += ":tkhd=3:group=2"
-                elif subtitle_defaults_set:
-                    # explicitly disable default if another track is default
-                    subtitle_opts += ":tkhd=0:group=2"
-
-                # forced flag
-                if subtitle.forced:
-                    subtitle_opts += ":txtflags=0xC0000000"
-
                 cmd.extend(["-add", f"{subtitle.input_file}{subtitle_opts}"])
 
             # add chapters if present
-            chapters_path: Path | None = None
             if job.chapters and job.chapters.chapters:
-                temp_file = tempfile.NamedTemporaryFile(
-                    prefix="mp4bc_", suffix=".txt", delete=False
-                )
-                temp_file.write(job.chapters.chapters.encode("utf-8"))
-                temp_file.close()  # we must close before MP4Box can read it (Windows file locking)
-                chapters_path = Path(temp_file.name)
-                cmd.extend(["-chap", str(chapters_path)])
+                chapters_file = _acquire_chapters_file(job.chapters.chapters)
+                cmd.extend(["-chap", str(chapters_file)])
 
             # -hdr none: prevents MP4Box adding double metadata headers
             # -proglf: enable progress logging for parsing
             # -new: create new output file
-            cmd.extend(["-hdr", "none", "-proglf", "-new", str(job.output_file)])
-            LOG.debug(f"MP4Box command: {' '.join(cmd)}")
-
-            # create subprocess with no window on Windows
-            startupinfo = None
-            creationflags = 0
-            is_windows = platform.system() == "Windows"
-            if is_windows:
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                creationflags = subprocess.CREATE_NO_WINDOW
-
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                startupinfo=startupinfo,
-                creationflags=creationflags,
+            cmd.extend(["-hdr", "none", "-proglf", "-new", output_file])
+            if log_output:
+                # quoted so the logged command can be pasted into a shell
+                cmd_line = (
+                    subprocess.list2cmdline(cmd) if IS_WINDOWS else shlex.join(cmd)
+                )
+                LOG.debug(f"MP4Box command: {cmd_line}")
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                startupinfo=_STARTUPINFO,
+                creationflags=_CREATIONFLAGS,
+                start_new_session=True,
             )
 
-            self.active_processes[job.job_id] = process
-
-            # Calculate total operations for accurate progress tracking
-            # MP4Box processes: video + audio track(s) + subtitle track(s) + final write
-            total_operations = 1  # video track (always present)
-            total_operations += len(job.audio_tracks)
-            total_operations += len(job.subtitle_tracks)
-            total_operations += 1  # final ISO file writing
+            with self._processes_lock:
+                self.active_processes[job.job_id] = process
+
+            # MP4Box operations in order, one stage label each:
+            # video + audio track(s) + subtitle track(s) + final write
+            audio_count = len(job.audio_tracks)
+            subtitle_count = len(job.subtitle_tracks)
+            stages = [
+                "Importing video",
+                *(
+                    f"Importing audio {i}/{audio_count}"
+                    for i in range(1, audio_count + 1)
+                ),
+                *(
+                    f"Importing subtitle {i}/{subtitle_count}"
+                    for i in range(1, subtitle_count + 1)
+                ),
+                "Writing output file",
+            ]
+            last_stage = len(stages) - 1
+            # share of the overall progress each operation accounts for
+            operation_weight = 100.0 / len(stages)
 
             current_operation = 0
             last_operation_progress = 0
-            all_output = []
+            # only the tail of the output is needed for the error message
+            all_output: deque[bytes] = deque(maxlen=MAX_ERROR_OUTPUT_LINES)
+            # output is read as raw bytes, only decoded when debug logging is on
+            last_progress_emit = 0.0
 
             if not process.stdout:
                 raise RuntimeError("Failed to capture MP4Box output")
 
-            for line in process.stdout:
-                # check if job was cancelled
-                current_job = self.queue_manager.get_job(job.job_id)
-                if current_job and current_job.status == JobStatus.CANCELLED:
-                    self._kill_process(process)
-                    return
+            # a cancelled job gets its process killed, which ends the read loop
+            # below with EOF (a silent MP4Box can't delay it)
+            cancel_watcher = asyncio.create_task(
+                self._kill_on_cancel(cancel_signal.event, process)
+            )
+            if job.cancel_event.is_set():
+                # cancelled before the signal was registered
+                cancel_signal.event.set()
 
+            async for line in _output_lines(process.stdout):
                 line = line.strip()
-                if line:
-                    LOG.debug(f"MP4Box output: {line}")
+                if line and log_output:
+                    LOG.debug(f"MP4Box output: {line.decode('utf-8', 'replace')}")
                 all_output.append(line)
 
                 # parse progress lines: "Import: |====| (XX/100)" or "ISO File Writing: |====| (XX/100)"
+                if not _PROGRESS_LINE_RE.search(line):
+                    continue
+                paren = line.rfind(b"(")
+                match = _PROGRESS_RE.match(line, paren + 1) if paren != -1 else None
+                if not match:
+                    continue
+                current_operation_progress = int(match.group(1))
+
+                # detect transition to next operation when progress drops from high to low
+                if current_operation_progress <= 5 and last_operation_progress >= 95:
+                    current_operation += 1
+
+                last_operation_progress = current_operation_progress
+
+                # calculate overall progress (0-100%)
+                overall_progress = (current_operation * operation_weight) + (
+                    current_operation_progress * operation_weight / 100.0
+                )
+                overall_progress = min(overall_progress, 100.0)
+
+                # rate-limit updates, but always report a finished operation
+                now = time.monotonic()
                 if (
-                    "Import:" in line
-                    or "Importing ISO File:" in line
-                    or "ISO File Writing:" in line
-                ) and "(" in line:
-                    try:
-                        # extract progress percentage
-                        progress_part = line.split("(")[-1].split("/")[0].strip()
-                        current_operation_progress = int(progress_part)
-
-                        # detect transition to next operation when progress drops from high to low
-                        if (
-                            current_operation_progress <= 5
-                            and last_operation_progress >= 95
-                        ):
-                            current_operation += 1
-
-                        last_operation_progress = current_operation_progress
-
-                        # calculate overall progress (0-100%)
-                        operation_weight = 100.0 / total_operations
-                        overall_progress = (current_operation * operation_weight) + (
-                            current_operation_progress * operation_weight / 100.0
-                        )
-                        overall_progress = min(overall_progress, 100.0)
-
-                        # determine descriptive stage message based on current operation
-                        if current_operation == 0:
-                            stage = "Importing video"
-                        elif current_operation <= len(job.audio_tracks):
-                            track_num = current_operation
-                            stage = (
-                                f"Importing audio {track_num}/{len(job.audio_tracks)}"
-                            )
-                        elif current_operation <= len(job.audio_tracks) + len(
-                            job.subtitle_tracks
-                        ):
-                            track_num = current_operation - len(job.audio_tracks)
-                            stage = f"Importing subtitle {track_num}/{len(job.subtitle_tracks)}"
-                        else:
-                            stage = "Writing output file"
-
-                        message = f"{stage} ({current_operation_progress}%) - {overall_progress:.1f}% overall"
-                        LOG.debug(message)
-                        self._notify_progress(overall_progress, message)
-                        self.queue_manager.update_job_progress(
-                            job.job_id, overall_progress, message
-                        )
-                    except (ValueError, IndexError):
-                        pass
-
-            return_code = process.wait()
-            self.active_processes.pop(job.job_id, None)
-
-            current_job = self.queue_manager.get_job(job.job_id)
-            if current_job and current_job.status == JobStatus.CANCELLED:
+                    now - last_progress_emit < PROGRESS_EMIT_INTERVAL
+                    and current_operation_progress < 100
+                ):
+                    continue
+                last_progress_emit = now
+
+                # descriptive stage message for the current operation
+                stage = stages[min(current_operation, last_stage)]
+
+                message = f"{stage} ({current_operation_progress}%) - {overall_progress:.1f}% overall"
+                if log_output:
+                    LOG.debug(message)
+                self._notify_progress(overall_progress, message)
+                self.queue_manager.update_job_progress(
+                    job.job_id, overall_progress, message
+                )
+
+            return_code = await process.wait()
+            with self._processes_lock:
+                self.active_processes.pop(job.job_id, None)
+
+            if job.cancel_event.is_set():
                 return
 
             if return_code == 0:
-                self.queue_manager.update_job_status(job.job_id, JobStatus.COMPLETED)
+                await self._set_status(job, JobStatus.COMPLETED)
                 self.queue_manager.update_job_progress(job.job_id, 100.0, "Completed")
-                LOG.debug(f"Mux completed successfully: {job.output_file}")
-                LOG.debug(f"Output file exists: {job.output_file.exists()}")
-                self._notify_complete(str(job.output_file))
+                if log_output:
+                    LOG.debug(f"Mux completed successfully: {output_file}")
+                    LOG.debug(f"Output file exists: {job.output_file.exists()}")
+                await asyncio.to_thread(self._notify_complete, output_file)
             else:
                 # capture detailed error from all output
-                error_details = "\n".join(all_output) if all_output else "Unknown error"
+                error_details = (
+                    b"\n".join(all_output).decode("utf-8", "replace")
+                    if all_output
+                    else "Unknown error"
+                )
                 error_msg = f"MP4Box exited with code {return_code}\n{error_details}"
                 LOG.error(f"MP4Box failed: {error_msg}")
-                self.queue_manager.update_job_status(
-                    job.job_id, JobStatus.FAILED, error_msg
-                )
-                self._notify_error(error_msg)
+                await self._set_status(job, JobStatus.FAILED, error_msg)
+                await asyncio.to_thread(self._notify_error, error_msg)
 
         except FileNotFoundError:
             error_msg = "MP4Box not found - please install MP4Box and add to PATH"
-            self.queue_manager.update_job_status(
-                job.job_id, JobStatus.FAILED, error_msg
-            )
-            self._notify_error(error_msg)
+            await self._set_status(job, JobStatus.FAILED, error_msg)
+            await asyncio.to_thread(self._notify_error, error_msg)
 
         except Exception as e:
             error_msg = f"Muxing failed: {str(e)}"
-            self.queue_manager.update_job_status(
-                job.job_id, JobStatus.FAILED, error_msg
-            )
-            self._notify_error(error_msg)
+            await self._set_status(job, JobStatus.FAILED, error_msg)
+            await asyncio.to_thread(self._notify_error, error_msg)
 
         finally:
-            if process and process.poll() is None:
-                self._kill_process(process)
-            self.active_processes.pop(job.job_id, None)
-            # delete chapters temp file if created
-            if chapters_path and chapters_path.exists():
-                chapters_path.unlink()
-
-    def _kill_process(self, process: subprocess.Popen) -> None:
-        """Kill process and all children using psutil"""
+            self.queue_manager.unregister_callback(cancel_signal)
+            if cancel_watcher:
+                cancel_watcher.cancel()
+            if process and process.returncode is None:
+                await self._kill_process(process)
+                await process.wait()
+            with self._processes_lock:
+                self.active_processes.pop(job.job_id, None)
+            if chapters_file:
+                _release_chapters_file(chapters_file)
+
+    async def _kill_on_cancel(
+        self, cancelled: asyncio.Event, process: asyncio.subprocess.Process
+    ) -> None:
+        """Kill the job's process once the job is cancelled"""
+        await cancelled.wait()
+        await self._kill_process(process)
+
+    async def _set_status(
+        self, job: MuxJob, status: JobStatus, error: str | None = None
+    ) -> None:
+        """Update the job status off the event loop (it's persisted to SQLite)"""
+        await asyncio.to_thread(
+            self.queue_manager.update_job_status, job.job_id, status, error
+        )
+
+    async def _kill_process(self, process: asyncio.subprocess.Process) -> None:
+        """Kill process and all children (reaped by the event loop awaiting it)"""
         try:
-            parent = psutil.Process(process.pid)
-            for child in parent.children(recursive=True):
-                try:
-                    child.kill()
-                except psutil.NoSuchProcess:
-                    pass
-            try:
-                parent.kill()
-            except psutil.NoSuchProcess:
-                pass
-            process.wait(timeout=2)
-        except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+            if IS_WINDOWS:
+                taskkill = await asyncio.create_subprocess_exec(
+                    "taskkill",
+                    "/T",
+                    "/F",
+                    "/PID",
+                    str(process.pid),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    startupinfo=_STARTUPINFO,
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                )
+                await taskkill.wait()
+            else:
+                # started with start_new_session, so the pid is also the group id
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
             try:
-                process.terminate()
-                process.wait(timeout=1)
+                process.kill()
             except:
                 pass
 
@@ -1,3 +1,4 @@
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +24,10 @@ class MuxJob:
     created_at: datetime = field(default_factory=datetime.now)
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    # set once the job is cancelled, so running muxes don't have to poll the queue
+    cancel_event: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         """Export job as dictionary for serialization"""
@@ -1,3 +1,9 @@
+import os
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from uuid import UUID
 
@@ -5,6 +11,23 @@ from core.enums.job_status import JobStatus
 from core.payloads.mux_job import MuxJob
 from core.queue_storage import QueueStorage
 
+# statuses a job can't leave on its own
+_DONE_STATUSES = frozenset((JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED))
+
+# minimum seconds between on_job_progress fan-outs per job (100% always goes out)
+PROGRESS_CALLBACK_INTERVAL = 0.1
+
+# number of MP4Box processes run() supervises at once by default (cores - 1)
+DEFAULT_CONCURRENCY = max(1, (os.cpu_count() or 2) - 1)
+
+
+def _mux_job(job: MuxJob) -> None:
+    """Mux a job with its own VideoMuxer (run()'s default process_job)"""
+    # imported here, core.muxer imports this module
+    from core.muxer import VideoMuxer
+
+    VideoMuxer().mux_from_job(job)
+
 
 class QueueCallback:
     """Override in UI layer to receive queue updates"""
@@ -28,18 +51,27 @@ class QueueManager:
     _instance = None
 
     def __new__(cls):
+        # all state is set up here, once, so repeated QueueManager() calls are cheap
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        if not hasattr(self, "_initialized"):
+            self = super().__new__(cls)
+            # insertion ordered, so this is also the queue order
             self.jobs: dict[UUID, MuxJob] = {}
-            self.queue_order: list[UUID] = []
-            self.callbacks: list[QueueCallback] = []
+            # storage sort key per job, only needs to increase with each add
+            self._positions: dict[UUID, int] = {}
+            self._next_position = 0
+            # insertion-ordered set of callbacks
+            self.callbacks: dict[QueueCallback, None] = {}
             self.is_processing = False
             self.storage: QueueStorage | None = None
-            self._initialized = True
+            # jobs and callbacks are touched from mux worker threads
+            self._lock = threading.RLock()
+            self._stop_requested = threading.Event()
+            # resolved by add_job so run() tops up free slots right away
+            self._wakeup: Future | None = None
+            # last on_job_progress dispatch per job (time.monotonic())
+            self._last_progress_dispatch: dict[UUID, float] = {}
+            cls._instance = self
+        return cls._instance
 
     def enable_persistence(self, storage: QueueStorage | None = None):
         """Enable persistent storage for the queue
@@ -63,52 +95,72 @@ class QueueManager:
         from core.queue_storage import deserialize_job_data
 
         loaded_jobs = self.storage.load_all_jobs()
-        for job_id, job_data, position in loaded_jobs:
-            job = deserialize_job_data(job_id, job_data)
-            self.jobs[job_id] = job
-            self.queue_order.append(job_id)
+        with self._lock:
+            for job_id, job_data, position in loaded_jobs:
+                job = deserialize_job_data(job_id, job_data)
+                self.jobs[job_id] = job
+                self._positions[job_id] = position
+                self._next_position = max(self._next_position, position + 1)
 
     def _save_to_storage(self):
         """Save current queue state to persistent storage"""
         if not self.storage:
             return
 
-        for position, job_id in enumerate(self.queue_order):
-            job = self.jobs.get(job_id)
-            if job:
-                self.storage.save_job(job, position)
+        with self._lock:
+            jobs = list(self.jobs.values())
+            self._positions = {job.job_id: pos for pos, job in enumerate(jobs)}
+            self._next_position = len(jobs)
+        self.storage.save_jobs((job, position) for position, job in enumerate(jobs))
 
     def register_callback(self, callback: QueueCallback):
         """Register a callback for queue updates"""
-        if callback not in self.callbacks:
-            self.callbacks.append(callback)
+        with self._lock:
+            self.callbacks.setdefault(callback, None)
 
     def unregister_callback(self, callback: QueueCallback):
         """Remove a callback"""
-        if callback in self.callbacks:
-            self.callbacks.remove(callback)
+        with self._lock:
+            self.callbacks.pop(callback, None)
+
+    def _get_callbacks(self) -> list[QueueCallback]:
+        """Snapshot of the callbacks so they can be invoked without the lock"""
+        with self._lock:
+            return list(self.callbacks)
 
     def add_job(self, job: MuxJob) -> UUID:
         """Add a job to the queue"""
-        self.jobs[job.job_id] = job
-        self.queue_order.append(job.job_id)
+        with self._lock:
+            self.jobs[job.job_id] = job
+            position = self._next_position
+            self._positions[job.job_id] = position
+            self._next_position += 1
 
         # persist to storage
         if self.storage:
-            self.storage.save_job(job, len(self.queue_order) - 1)
+            self.storage.save_job(job, position)
 
-        for callback in self.callbacks:
+        for callback in self._get_callbacks():
             callback.on_job_added(job)
 
+        self._wake_runner()
+
         return job.job_id
 
+    def _wake_runner(self):
+        """Wake run() so it can start newly queued jobs before a slot frees up"""
+        with self._lock:
+            if self._wakeup is not None and not self._wakeup.done():
+                self._wakeup.set_result(None)
+
     def get_job(self, job_id: UUID) -> MuxJob | None:
         """Get a specific job by ID"""
         return self.jobs.get(job_id)
 
     def get_all_jobs(self) -> list[MuxJob]:
         """Get all jobs in queue order"""
-        return [self.jobs[jid] for jid in self.queue_order if jid in self.jobs]
+        with self._lock:
+            return list(self.jobs.values())
 
     def get_queued_jobs(self) -> list[MuxJob]:
         """Get jobs waiting to be processed"""
@@ -118,27 +170,30 @@ class QueueManager:
         self, job_id: UUID, status: JobStatus, error: str | None = None
     ):
         """Update job status"""
-        job = self.jobs.get(job_id)
-        if not job:
-            return
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return
+
+            job.status = status
+            if error:
+                job.error_message = error
+
+            if status == JobStatus.CANCELLED:
+                job.cancel_event.set()
 
-        job.status = status
-        if error:
-            job.error_message = error
+            if status == JobStatus.PROCESSING:
+                job.started_at = datetime.now()
+            elif status in _DONE_STATUSES:
+                job.completed_at = datetime.now()
 
-        if status == JobStatus.PROCESSING:
-            job.started_at = datetime.now()
-        elif status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-            job.completed_at = datetime.now()
+            position = self._positions.get(job_id, 0)
 
         # persist status change
         if self.storage:
-            position = (
-                self.queue_order.index(job_id) if job_id in self.queue_order else 0
-            )
-            self.storage.save_job(job, position)
+            self.storage.save_job_status(job, position)
 
-        for callback in self.callbacks:
+        for callback in self._get_callbacks():
             callback.on_job_status_changed(job)
 
     def update_job_progress(self, job_id: UUID, progress: float, message: str = ""):
@@ -149,15 +204,26 @@ class QueueManager:
 
         job.progress = progress
 
-        for callback in self.callbacks:
+        # coalesce bursts (the muxer reports each tick directly and through its
+        # progress callback), the latest value is still stored on the job
+        now = time.monotonic()
+        if (
+            progress < 100
+            and now - self._last_progress_dispatch.get(job_id, 0.0)
+            < PROGRESS_CALLBACK_INTERVAL
+        ):
+            return
+        self._last_progress_dispatch[job_id] = now
+
+        for callback in self._get_callbacks():
             callback.on_job_progress(job, progress, message)
 
     def remove_job(self, job_id: UUID):
         """Remove a job from the queue"""
-        if job_id in self.jobs:
-            del self.jobs[job_id]
-        if job_id in self.queue_order:
-            self.queue_order.remove(job_id)
+        with self._lock:
+            self.jobs.pop(job_id, None)
+            self._positions.pop(job_id, None)
+            self._last_progress_dispatch.pop(job_id, None)
 
         # remove from storage
         if self.storage:
@@ -165,14 +231,20 @@ class QueueManager:
 
     def clear_completed(self):
         """Remove all completed/failed/cancelled jobs"""
-        to_remove = [
-            jid
-            for jid, job in self.jobs.items()
-            if job.status
-            in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
-        ]
-        for jid in to_remove:
-            self.remove_job(jid)
+        with self._lock:
+            self.jobs = {
+                jid: job
+                for jid, job in self.jobs.items()
+                if job.status not in _DONE_STATUSES
+            }
+            self._positions = {
+                jid: pos for jid, pos in self._positions.items() if jid in self.jobs
+            }
+            self._last_progress_dispatch = {
+                jid: ts
+                for jid, ts in self._last_progress_dispatch.items()
+                if jid in self.jobs
+            }
 
         # batch delete from storage
         if self.storage:
@@ -183,3 +255,76 @@ class QueueManager:
         job = self.jobs.get(job_id)
         if job and job.status in (JobStatus.QUEUED, JobStatus.PROCESSING):
             self.update_job_status(job_id, JobStatus.CANCELLED)
+
+    def run(
+        self,
+        concurrency: int | None = None,
+        process_job: Callable[[MuxJob], None] | None = None,
+    ):
+        """Process queued jobs, several at a time, until the queue is drained
+
+        Each worker thread only supervises an MP4Box process, so threads are
+        enough to run independent muxes in parallel. Jobs queued while running
+        start as soon as a slot is free. Blocks until done or stop() is called.
+
+        Args:
+            concurrency: Max jobs at once. If None, uses DEFAULT_CONCURRENCY.
+            process_job: Runs a single job. If None, each job is muxed by its own
+                VideoMuxer.
+        """
+        if process_job is None:
+            process_job = _mux_job
+
+        max_workers = max(1, concurrency or DEFAULT_CONCURRENCY)
+        submitted: set[UUID] = set()
+        pending: dict[Future, MuxJob] = {}
+
+        self._stop_requested.clear()
+        self.is_processing = True
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="mux"
+            ) as executor:
+                while True:
+                    # armed before the top up, so a job added during it still
+                    # wakes the wait below
+                    with self._lock:
+                        self._wakeup = wakeup = Future()
+
+                    # top up free slots (stop only prevents new jobs from starting)
+                    if not self._stop_requested.is_set():
+                        for job in self.get_queued_jobs():
+                            if len(pending) >= max_workers:
+                                break
+                            if job.job_id in submitted:
+                                continue
+                            submitted.add(job.job_id)
+                            pending[executor.submit(process_job, job)] = job
+
+                    if not pending:
+                        break
+
+                    done, _ = wait([*pending, wakeup], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future is wakeup:
+                            continue
+                        job = pending.pop(future)
+                        error = future.exception()
+                        if error is not None:
+                            tb = "".join(traceback.format_exception(error))
+                            self.update_job_status(
+                                job.job_id,
+                                JobStatus.FAILED,
+                                f"Muxing failed: {error}\n\nTraceback:\n{tb}",
+                            )
+        finally:
+            with self._lock:
+                self._wakeup = None
+            self.is_processing = False
+
+        for callback in self._get_callbacks():
+            callback.on_queue_completed()
+
+    def stop(self):
+        """Stop run() from starting new jobs (running jobs finish normally)"""
+        self._stop_requested.set()
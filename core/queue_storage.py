@@ -1,15 +1,17 @@
 import json
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from uuid import UUID
 
-from iso639 import Language
-
 from core.enums.job_status import JobStatus
 from core.job_states import AudioState, ChapterState, SubtitleState, VideoState
 from core.logger import LOG
 from core.payloads.mux_job import MuxJob
+from core.utils.language import language_from_part3
 from core.utils.working_dir import CONFIG_DIR
 
 ######### IMPORTANT #########
@@ -18,6 +20,28 @@ from core.utils.working_dir import CONFIG_DIR
 DB_VERSION = 1
 ######### IMPORTANT #########
 
+# statements run on every queue change, kept as constants so the text is
+# identical each call and sqlite3's per-connection statement cache is hit
+_SQL_UPSERT_JOB = """
+    INSERT OR REPLACE INTO jobs (
+        job_id, video_state, audio_tracks, subtitle_tracks, chapters,
+        output_file, status, error_message,
+        created_at, started_at, completed_at, queue_position
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_STATUS = """
+    UPDATE jobs SET
+        status = ?, error_message = ?, started_at = ?,
+        completed_at = ?, queue_position = ?
+    WHERE job_id = ?
+"""
+_SQL_DELETE_JOB = "DELETE FROM jobs WHERE job_id = ?"
+_SQL_DELETE_DONE = """
+    DELETE FROM jobs
+    WHERE status IN ('COMPLETED', 'FAILED', 'CANCELLED')
+"""
+_SQL_SELECT_ALL = "SELECT * FROM jobs ORDER BY queue_position"
+
 
 class QueueStorage:
     """SQLite-based persistent storage for job queue"""
@@ -30,11 +54,33 @@ class QueueStorage:
         """
         self.db_path = db_path or CONFIG_DIR / "queue.db"
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # one connection for the queue's lifetime, shared by the UI and mux threads
+        self._lock = threading.RLock()
+        self._conn = self._connect()
         self._init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection with the per-connection tuning applied"""
+        # sqlite3's default 5 s timeout already acts as the busy timeout,
+        # access from several threads is serialized by _transaction()
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # write-ahead log, persisted in the db file so it only has to be set once
+        conn.execute("PRAGMA journal_mode=WAL")
+        # in WAL mode only checkpoints need to fsync, commits can't corrupt
+        # the db (worst case a power loss drops the last few status updates)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Exclusive use of the shared connection, committed on success"""
+        with self._lock, self._conn:
+            yield self._conn
+
     def _init_database(self) -> None:
         """Create database tables if they don't exist, check version compatibility"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             # create version table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS db_version (
@@ -56,9 +102,9 @@ class QueueStorage:
                 # backup old database
                 backup_path = self.db_path.with_suffix(f".v{current_version}.bak")
                 try:
-                    import shutil
-
-                    shutil.copy2(self.db_path, backup_path)
+                    # backup API also picks up changes still sitting in the WAL
+                    with sqlite3.connect(backup_path) as backup_conn:
+                        conn.backup(backup_conn)
                     LOG.info(f"Backed up old queue to {backup_path}")
                 except Exception as e:
                     LOG.error(f"Failed to backup old queue: {e}")
@@ -110,38 +156,48 @@ class QueueStorage:
             job: MuxJob instance to save
             position: Position in queue order
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO jobs (
-                    job_id, video_state, audio_tracks, subtitle_tracks, chapters,
-                    output_file, status, error_message,
-                    created_at, started_at, completed_at, queue_position
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        self.save_jobs([(job, position)])
+
+    def save_jobs(self, items: Iterable[tuple["MuxJob", int]]) -> None:
+        """Save or update several jobs in a single transaction
+
+        Args:
+            items: (MuxJob, position in queue order) pairs
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                _SQL_UPSERT_JOB,
+                (_job_row(job, position) for job, position in items),
+            )
+            conn.commit()
+
+    def save_job_status(self, job: "MuxJob", position: int) -> None:
+        """Update only the status columns of a saved job
+
+        Track and chapter data doesn't change once a job is queued, so status
+        changes skip re-serializing it. Unsaved jobs are saved in full.
+
+        Args:
+            job: MuxJob instance to update
+            position: Position in queue order
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                _SQL_UPDATE_STATUS,
                 (
-                    str(job.job_id),
-                    json.dumps(_serialize_video_state(job.video))
-                    if job.video
-                    else None,
-                    json.dumps([_serialize_audio_state(a) for a in job.audio_tracks]),
-                    json.dumps(
-                        [_serialize_subtitle_state(s) for s in job.subtitle_tracks]
-                    ),
-                    json.dumps(_serialize_chapter_state(job.chapters))
-                    if job.chapters
-                    else None,
-                    str(job.output_file),
                     job.status.name,
                     job.error_message,
-                    job.created_at.isoformat(),
                     job.started_at.isoformat() if job.started_at else None,
                     job.completed_at.isoformat() if job.completed_at else None,
                     position,
+                    str(job.job_id),
                 ),
             )
             conn.commit()
 
+        if cursor.rowcount == 0:
+            self.save_job(job, position)
+
     def load_all_jobs(self) -> list[tuple[UUID, dict, int]]:
         """Load all jobs from database
 
@@ -149,11 +205,11 @@ class QueueStorage:
             List of (job_id, job_data_dict, queue_position) tuples
             sorted by queue_position
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM jobs ORDER BY queue_position
-            """)
+        with self._transaction() as conn:
+            # on this cursor only, the connection is shared with other queries
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(_SQL_SELECT_ALL)
 
             results = []
             for row in cursor:
@@ -184,64 +240,62 @@ class QueueStorage:
         Args:
             job_id: UUID of job to remove
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM jobs WHERE job_id = ?", (str(job_id),))
+        with self._transaction() as conn:
+            conn.execute(_SQL_DELETE_JOB, (str(job_id),))
             conn.commit()
 
     def delete_completed_jobs(self) -> None:
         """Remove all completed, failed, and cancelled jobs"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                DELETE FROM jobs 
-                WHERE status IN ('COMPLETED', 'FAILED', 'CANCELLED')
-            """)
+        with self._transaction() as conn:
+            conn.execute(_SQL_DELETE_DONE)
             conn.commit()
 
     def clear_all(self) -> None:
         """Clear entire queue database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             conn.execute("DELETE FROM jobs")
             conn.commit()
 
 
+# one compact encoder for every row (json.dumps builds a new one per call
+# when given any non-default option)
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
 # serialization helpers
-def _serialize_video_state(state: VideoState) -> dict:
-    """Convert VideoState to JSON-serializable dict"""
-    return {
-        "input_file": str(state.input_file),
-        "language": state.language.part3 if state.language else None,
-        "title": state.title,
-        "delay_ms": state.delay_ms,
-    }
+def _job_row(job: "MuxJob", position: int) -> tuple:
+    """Column values for a job's row in the jobs table"""
+    return (
+        str(job.job_id),
+        _JSON_ENCODER.encode(job.video.to_dict()) if job.video else None,
+        _JSON_ENCODER.encode([a.to_dict() for a in job.audio_tracks]),
+        _JSON_ENCODER.encode([s.to_dict() for s in job.subtitle_tracks]),
+        _JSON_ENCODER.encode(job.chapters.to_dict()) if job.chapters else None,
+        str(job.output_file),
+        job.status.name,
+        job.error_message,
+        job.created_at.isoformat(),
+        job.started_at.isoformat() if job.started_at else None,
+        job.completed_at.isoformat() if job.completed_at else None,
+        position,
+    )
 
 
 def _deserialize_video_state(data: dict) -> VideoState:
     """Reconstruct VideoState from dict"""
     return VideoState(
         input_file=Path(data["input_file"]),
-        language=Language.from_part3(data["language"]) if data["language"] else None,
+        language=language_from_part3(data["language"]) if data["language"] else None,
         title=data["title"],
         delay_ms=data["delay_ms"],
     )
 
 
-def _serialize_audio_state(state: AudioState) -> dict:
-    """Convert AudioState to JSON-serializable dict"""
-    return {
-        "input_file": str(state.input_file),
-        "language": state.language.part3 if state.language else None,
-        "title": state.title,
-        "delay_ms": state.delay_ms,
-        "default": state.default,
-        "track_id": state.track_id,
-    }
-
-
 def _deserialize_audio_state(data: dict) -> AudioState:
     """Reconstruct AudioState from dict"""
     return AudioState(
         input_file=Path(data["input_file"]),
-        language=Language.from_part3(data["language"]) if data["language"] else None,
+        language=language_from_part3(data["language"]) if data["language"] else None,
         title=data["title"],
         delay_ms=data["delay_ms"],
         default=data["default"],
@@ -249,23 +303,11 @@ def _deserialize_audio_state(data: dict) -> AudioState:
     )
 
 
-def _serialize_subtitle_state(state: SubtitleState) -> dict:
-    """Convert SubtitleState to JSON-serializable dict"""
-    return {
-        "input_file": str(state.input_file),
-        "language": state.language.part3 if state.language else None,
-        "title": state.title,
-        "default": state.default,
-        "forced": state.forced,
-        "track_id": state.track_id,
-    }
-
-
 def _deserialize_subtitle_state(data: dict) -> SubtitleState:
     """Reconstruct SubtitleState from dict"""
     return SubtitleState(
         input_file=Path(data["input_file"]),
-        language=Language.from_part3(data["language"]) if data["language"] else None,
+        language=language_from_part3(data["language"]) if data["language"] else None,
         title=data["title"],
         default=data["default"],
         forced=data["forced"],
@@ -273,13 +315,6 @@ def _deserialize_subtitle_state(data: dict) -> SubtitleState:
     )
 
 
-def _serialize_chapter_state(state: ChapterState) -> dict:
-    """Convert ChapterState to JSON-serializable dict"""
-    return {
-        "chapters": state.chapters,
-    }
-
-
 def _deserialize_chapter_state(data: dict) -> ChapterState:
     """Reconstruct ChapterState from dict"""
     return ChapterState(
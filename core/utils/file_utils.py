@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".avi", ".mov", ".wmv")
+
 
 def browse_directory(path: Path | None = None) -> dict:
     """
@@ -22,12 +24,15 @@ def browse_directory(path: Path | None = None) -> dict:
     with os.scandir(target_path) as entries:
         for entry in entries:
             try:
+                # is_dir/is_file use the cached d_type, only files need a stat
+                is_dir = entry.is_dir()
+                size = entry.stat().st_size if not is_dir and entry.is_file() else None
                 items.append(
                     {
                         "name": entry.name,
                         "path": entry.path,
-                        "is_dir": entry.is_dir(),
-                        "size": entry.stat().st_size if entry.is_file() else None,
+                        "is_dir": is_dir,
+                        "size": size,
                     }
                 )
             except (OSError, PermissionError):
@@ -48,18 +53,35 @@ def browse_directory(path: Path | None = None) -> dict:
     }
 
 
+def _sorted_entries(path: Path) -> list[os.DirEntry]:
+    """Directory entries, directories first then by name (empty if not a directory)"""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    # DirEntry.is_dir uses the cached d_type, so sorting doesn't stat each entry
+    entries.sort(key=lambda e: (not e.is_dir(), e.name))
+    return entries
+
+
 def list_directory(path: Path) -> list[Path]:
     """List files in directory"""
-    if not path.exists() or not path.is_dir():
-        return []
-    return sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
+    return [Path(e.path) for e in _sorted_entries(path)]
 
 
 def get_video_files(path: Path) -> list[Path]:
     """Get only video files"""
-    video_exts = {".mp4", ".mkv", ".avi", ".mov", ".wmv"}
-    return [
-        f
-        for f in list_directory(path)
-        if f.is_file() and f.suffix.lower() in video_exts
-    ]
+    try:
+        with os.scandir(path) as it:
+            # filter on the name first, so only matches pay for is_file()
+            matches = [
+                e
+                for e in it
+                if e.name.lower().endswith(VIDEO_EXTENSIONS) and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    # sort after filtering (all files, so only the name matters)
+    matches.sort(key=lambda e: e.name)
+    return [Path(e.path) for e in matches]
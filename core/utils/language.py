@@ -1,9 +1,47 @@
 import re
+from collections.abc import Iterator
+from functools import lru_cache
 
 from iso639 import Language, LanguageNotFoundError
 from pymediainfo import Track
 
 
+@lru_cache(maxsize=2048)
+def _match(code: str) -> Language | None:
+    """Cached Language.match, None instead of raising when there's no match"""
+    try:
+        return Language.match(code)
+    except LanguageNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def language_from_part3(code: str) -> Language:
+    """Cached Language.from_part3 for restoring saved 3-letter codes"""
+    return Language.from_part3(code)
+
+
+# char_code -> Language attribute holding that code
+_PART_ATTRS = {1: "part1", 2: "part2b"}
+
+
+# common patterns: "movie.eng.srt", "movie_eng_sub.srt", "movie.en.srt", etc.
+# look for word boundaries or underscores/dots around language codes
+_FILENAME_LANG_PATTERNS = (
+    re.compile(r"[._-]([a-zA-Z]{2,3})[._-]"),  # .eng. or _en_ or -jpn-
+    re.compile(r"[._-]([a-zA-Z]{2,3})$"),  # .eng or _en at end
+    re.compile(r"^([a-zA-Z]{2,3})[._-]"),  # eng. or en_ at start
+)
+
+
+def _track_language_candidates(media_track: Track) -> Iterator[str]:
+    """The track's language, then each alternate name and its first word"""
+    yield media_track.language
+    for other in media_track.other_language or ():
+        yield other
+        yield other.split(" ")[0]
+
+
 def get_language_mi(media_track: Track, char_code: int = 1) -> str | None:
     """Used to properly detect the input language from pymediainfo track
 
@@ -11,35 +49,15 @@ def get_language_mi(media_track: Track, char_code: int = 1) -> str | None:
         media_track (Track): pymediainfo track
         char_code (int, optional): 1 or 2, if set to 2 it returns 'en' else if 3 it returns 'eng'
     """
-    if char_code not in {1, 2}:
+    attr = _PART_ATTRS.get(char_code)
+    if attr is None:
         raise ValueError("Input must be (int) 1 or 2")
 
     if media_track.language:
-        try:
-            if char_code == 1:
-                return str(Language.match(media_track.language).part1).upper()
-            elif char_code == 2:
-                return str(Language.match(media_track.language).part2b).upper()
-        except LanguageNotFoundError:
-            if media_track.other_language:
-                for track in media_track.other_language:
-                    try:
-                        if char_code == 1:
-                            return str(Language.match(track).part1).upper()
-                        elif char_code == 2:
-                            return str(Language.match(track).part2b).upper()
-                    except LanguageNotFoundError:
-                        try:
-                            if char_code == 1:
-                                return str(
-                                    Language.match(track.split(" ")[0]).part1
-                                ).upper()
-                            elif char_code == 2:
-                                return str(
-                                    Language.match(track.split(" ")[0]).part2b
-                                ).upper()
-                        except LanguageNotFoundError:
-                            continue
+        for candidate in _track_language_candidates(media_track):
+            language = _match(candidate)
+            if language:
+                return str(getattr(language, attr)).upper()
     return None
 
 
@@ -50,17 +68,14 @@ def get_language_str(language_str: str, char_code: int = 1) -> str | None:
         language_str (str): Language input string
         char_code (int, optional): 1 or 2, if set to 2 it returns 'en' else if 3 it returns 'eng'
     """
-    if char_code not in {1, 2}:
+    attr = _PART_ATTRS.get(char_code)
+    if attr is None:
         raise ValueError("Input must be (int) 1 or 2")
 
     if language_str:
-        try:
-            if char_code == 1:
-                return str(Language.match(language_str).part1).upper()
-            elif char_code == 2:
-                return str(Language.match(language_str).part2b).upper()
-        except LanguageNotFoundError:
-            return None
+        language = _match(language_str)
+        if language:
+            return str(getattr(language, attr)).upper()
     return None
 
 
@@ -71,10 +86,9 @@ def get_full_language_str(language_str: str) -> str | None:
         language_str (str): Language input string
     """
     if language_str:
-        try:
-            return str(Language.match(language_str.lower()).name)
-        except LanguageNotFoundError:
-            return None
+        language = _match(language_str.lower())
+        if language:
+            return str(language.name)
     return None
 
 
@@ -85,10 +99,7 @@ def get_language_obj(language_str: str) -> Language | None:
         language_str (str): Language input string
     """
     if language_str:
-        try:
-            return Language.match(language_str.lower())
-        except LanguageNotFoundError:
-            return None
+        return _match(language_str.lower())
     return None
 
 
@@ -107,37 +118,28 @@ def detect_language_from_filename(filename: str) -> Language | None:
     # remove extension but keep original case
     name_no_ext = filename.rsplit(".", 1)[0]
 
-    # common patterns: "movie.eng.srt", "movie_eng_sub.srt", "movie.en.srt", etc.
-    # look for word boundaries or underscores/dots around language codes
-    patterns = [
-        r"[._-]([a-zA-Z]{2,3})[._-]",  # .eng. or _en_ or -jpn-
-        r"[._-]([a-zA-Z]{2,3})$",  # .eng or _en at end
-        r"^([a-zA-Z]{2,3})[._-]",  # eng. or en_ at start
-    ]
-
-    # collect all candidates with their case type
+    # lowercase codes have the highest priority and are tried in pattern order,
+    # so the first one that matches wins without collecting the rest
     candidates = []
-    for pattern in patterns:
-        matches = re.finditer(pattern, name_no_ext)
-        for match in matches:
+    for pattern in _FILENAME_LANG_PATTERNS:
+        for match in pattern.finditer(name_no_ext):
             lang_code = match.group(1)
-            # determine case type for priority
             if lang_code.islower():
-                priority = 0  # highest priority
+                language = _match(lang_code)
+                if language:
+                    return language
             elif lang_code.isupper():
-                priority = 1  # medium priority
+                candidates.append((1, lang_code))  # medium priority
             else:
-                priority = 2  # lowest priority (mixed case)
-            candidates.append((priority, lang_code))
+                candidates.append((2, lang_code))  # lowest priority (mixed case)
 
     # sort by priority (lower number = higher priority)
     candidates.sort(key=lambda x: x[0])
 
     # try to match in priority order
     for _, lang_code in candidates:
-        try:
-            return Language.match(lang_code.lower())
-        except LanguageNotFoundError:
-            continue
+        language = _match(lang_code.lower())
+        if language:
+            return language
 
     return None
@@ -272,6 +272,8 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(str(RUNTIME_DIR / "images" / "mp4.png")))
     app.setStyle("Fusion")
+    # write any config changes that weren't saved explicitly
+    app.aboutToQuit.connect(Conf.flush)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -57,28 +57,27 @@ class MuxWorker(QThread):
         self.is_running = True
 
     def run(self) -> None:
-        """Process jobs from queue sequentially"""
-        while self.is_running:
-            queued_jobs = self.queue_manager.get_queued_jobs()
-
-            # if no jobs, exit the worker (queue is complete)
-            if not queued_jobs:
-                break
-
-            job = queued_jobs[0]
-            try:
-                self.muxer.mux_from_job(job)
-                self.job_finished.emit(job.job_id)
-            except Exception as e:
-                # catch any exceptions during muxing and link to the job
-                error_msg = (
-                    f"Muxing failed: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
-                )
-                self.job_failed.emit(job.job_id, error_msg)
+        """Process queued jobs in parallel, exits once the queue is complete"""
+        self.queue_manager.run(process_job=self._process_job)
+
+    def _process_job(self, job: MuxJob) -> None:
+        """Mux a single job (called from the queue manager's worker threads)"""
+        if not self.is_running:
+            return
+        try:
+            self.muxer.mux_from_job(job)
+            self.job_finished.emit(job.job_id)
+        except Exception as e:
+            # catch any exceptions during muxing and link to the job
+            error_msg = (
+                f"Muxing failed: {str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+            )
+            self.job_failed.emit(job.job_id, error_msg)
 
     def stop(self) -> None:
-        """Signal thread to stop gracefully after current job finishes"""
+        """Signal thread to stop gracefully after the running jobs finish"""
         self.is_running = False
+        self.queue_manager.stop()
 
 
 class DesktopQueueCallback(QueueCallback):
@@ -232,9 +231,8 @@ class OutputTab(QWidget):
 
     @Slot()
     def _on_add_and_clear_changed(self) -> None:
-        """Save add_and_clear checkbox state to config"""
+        """Save add_and_clear checkbox state to config (written to disk shortly after)"""
         self.main_window.conf.output_add_and_clear = self.add_and_clear.isChecked()
-        self.main_window.conf.save()
 
     @Slot(object)
     def _on_suggested_output_filepath(self, suggested_path: Path) -> None:
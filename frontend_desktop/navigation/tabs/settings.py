@@ -25,6 +25,11 @@ from frontend_desktop.widgets.preset_title_editor import PresetTitleEditor
 from frontend_desktop.widgets.qtawesome_theme_swapper import QTAThemeSwap
 from frontend_desktop.widgets.utils import build_h_line
 
+# file dialog filter for the MP4Box executable (platform doesn't change at runtime)
+_MP4BOX_FILE_FILTER = (
+    "Mp4Box (mp4box.exe)" if platform.system() == "Windows" else "Mp4Box (mp4box)"
+)
+
 
 class GeneralSettingsTab(QWidget):
     """General settings tab with scrollable content."""
@@ -169,14 +174,11 @@ class GeneralSettingsTab(QWidget):
     @Slot()
     def _browse_mp4box(self) -> None:
         """Browse for MP4Box executable"""
-        is_windows = platform.system() == "Windows"
-        file_filter = "Mp4Box (mp4box.exe)" if is_windows else "Mp4Box (mp4box)"
-
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select MP4Box Executable",
             "",
-            file_filter,
+            _MP4BOX_FILE_FILTER,
         )
         if file_path:
             self.mp4box_line_edit.setText(file_path)
@@ -104,6 +104,19 @@ function handleWebSocketMessage(data: any) {
       jobs.set(data.jobs.map(normalizeJob));
       break;
 
+    case "init_chunk":
+      // remaining pages of the initial job list (skip jobs already received)
+      jobs.update((j) => {
+        const known = new Set(j.map((job) => job.id));
+        return [
+          ...j,
+          ...data.jobs
+            .filter((job: any) => !known.has(job.id))
+            .map(normalizeJob),
+        ];
+      });
+      break;
+
     case "job_added":
       // new job added
       jobs.update((j) => [...j, normalizeJob(data.job)]);